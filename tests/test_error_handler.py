@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Unit tests for error handler pooling and retry helpers
+"""
+
+import unittest
+import asyncio
+import logging
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add voice_control to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_control.core import error_handler
+from voice_control.core.error_handler import (
+    ProductionErrorHandler, get_error_handler, retry_on_failure, retry_call, critical_operation, async_critical_operation,
+    async_retry_on_failure, AudioError, ErrorSeverity
+)
+
+
+class TestErrorPooling(unittest.TestCase):
+    """Test pooled error instances"""
+    
+    def test_pooled_error_reuse(self):
+        """Test that released errors are reused by acquire"""
+        error = AudioError.acquire("first")
+        error.release()
+        
+        reused = AudioError.acquire("second", ErrorSeverity.HIGH)
+        self.assertIs(reused, error)
+        self.assertEqual(str(reused), "second")
+        self.assertEqual(reused.severity, ErrorSeverity.HIGH)
+        self.assertIsNot(AudioError.acquire("third"), error)
+
+
+
+class TestRetryDecorators(unittest.TestCase):
+    """Test retrying decorators and helpers"""
+    
+    def test_retry_on_failure_coroutine(self):
+        """Test that retry_on_failure awaits coroutine functions between attempts"""
+        attempts = []
+        
+        @retry_on_failure(max_retries=2, delay=0.01)
+        async def flaky_operation():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ValueError("Test error")
+            return "success"
+        
+        self.assertTrue(asyncio.iscoroutinefunction(flaky_operation))
+        self.assertEqual(asyncio.run(flaky_operation()), "success")
+        self.assertEqual(len(attempts), 3)
+    
+    def test_async_retry_on_failure_gives_up(self):
+        """Test that async_retry_on_failure re-raises the last error once retries run out"""
+        attempts = []
+        
+        @async_retry_on_failure(max_retries=2, delay=0.01)
+        async def failing_operation():
+            attempts.append(1)
+            raise ValueError(f"Test error {len(attempts)}")
+        
+        with self.assertRaisesRegex(ValueError, "Test error 3"):
+            asyncio.run(failing_operation())
+        self.assertEqual(len(attempts), 3)
+    
+    def test_critical_operation_coroutine_gives_up(self):
+        """Test that critical_operation on a coroutine retries, then marks the component critical"""
+        attempts = []
+        
+        @critical_operation("test_async_critical", max_retries=1, retry_delay=0.01)
+        async def failing_operation():
+            attempts.append(1)
+            raise ValueError("Test error")
+        
+        self.assertTrue(asyncio.iscoroutinefunction(failing_operation))
+        with self.assertRaises(ValueError):
+            asyncio.run(failing_operation())
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(get_error_handler().component_states.get("test_async_critical"), "critical")
+    
+    def test_async_critical_operation_recovers(self):
+        """Test that async_critical_operation marks the component healthy after a retry succeeds"""
+        attempts = []
+        
+        @async_critical_operation("test_async_recovery", max_retries=2, retry_delay=0.01)
+        async def flaky_operation():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise ValueError("Test error")
+            return "success"
+        
+        self.assertEqual(asyncio.run(flaky_operation()), "success")
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(get_error_handler().component_states.get("test_async_recovery"), "healthy")
+    
+    def test_retry_call(self):
+        """Test that retry_call retries a plain callable and passes its arguments through"""
+        attempts = []
+        
+        def flaky_operation(value, suffix=""):
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise ValueError("Test error")
+            return value + suffix
+        
+        result = retry_call(flaky_operation, "success", suffix="!", max_retries=2, delay=0.01)
+        self.assertEqual(result, "success!")
+        self.assertEqual(len(attempts), 2)
+    
+    def test_jittered_backoff_stays_under_max_delay(self):
+        """Test that jitter never stretches a capped backoff past max_delay"""
+        sleeps = []
+        
+        def failing_operation():
+            raise ValueError("Test error")
+        
+        # Always jitter to the top of the range
+        with patch.object(error_handler._rand, 'uniform', side_effect=lambda low, high: high), \
+                patch.object(error_handler._shutdown_event, 'wait', side_effect=lambda delay: sleeps.append(delay)):
+            with self.assertRaises(ValueError):
+                retry_call(failing_operation, max_retries=4, delay=1.0, max_delay=2.0)
+        
+        self.assertEqual(sleeps, [1.5, 2.0, 2.0, 2.0])
+    
+    def test_async_jittered_backoff_stays_under_max_delay(self):
+        """Test that coroutine retries cap jittered backoffs at max_delay too"""
+        sleeps = []
+        
+        async def record_sleep(delay):
+            sleeps.append(delay)
+        
+        @async_retry_on_failure(max_retries=4, delay=1.0, max_delay=2.0)
+        async def failing_operation():
+            raise ValueError("Test error")
+        
+        with patch.object(error_handler._rand, 'uniform', side_effect=lambda low, high: high), \
+                patch.object(error_handler.asyncio, 'sleep', side_effect=record_sleep):
+            with self.assertRaises(ValueError):
+                asyncio.run(failing_operation())
+        
+        self.assertEqual(sleeps, [1.5, 2.0, 2.0, 2.0])
+    
+    def test_critical_operation_unlisted_exception(self):
+        """Test that critical_operation does not retry exceptions outside its tuple"""
+        attempts = []
+        
+        @critical_operation("test_critical", max_retries=2, retry_delay=0.01,
+                            exceptions=(IOError,))
+        def failing_operation():
+            attempts.append(1)
+            raise ValueError("Test error")
+        
+        with self.assertRaises(ValueError):
+            failing_operation()
+        self.assertEqual(len(attempts), 1)
+
+
+class TestErrorLogging(unittest.TestCase):
+    """Test the shared error log writer"""
+    
+    def test_setup_once_per_process(self):
+        """Test that later handlers don't add another writer to the error logger"""
+        get_error_handler()
+        listener = error_handler._error_log_listener
+        error_logger = logging.getLogger("voice_control.errors")
+        handlers = list(error_logger.handlers)
+        
+        ProductionErrorHandler()
+        self.assertIs(error_handler._error_log_listener, listener)
+        self.assertEqual(error_logger.handlers, handlers)
+        self.assertEqual(len(handlers), 1)
+
+
+class TestSignalReporting(unittest.TestCase):
+    """Test the process-wide crash reporting plumbing"""
+    
+    def tearDown(self):
+        signal.alarm(0)
+        error_handler._signal_pending = False
+    
+    def test_setup_once_per_process(self):
+        """Test that later handlers reuse the crash log descriptor and signal pipe"""
+        get_error_handler()
+        crash_fd, signal_pipe = error_handler._crash_fd, error_handler._signal_pipe
+        self.assertIsNotNone(signal_pipe)
+        
+        handler = ProductionErrorHandler()
+        self.assertEqual(error_handler._crash_fd, crash_fd)
+        self.assertEqual(error_handler._signal_pipe, signal_pipe)
+        self.assertIs(error_handler._signal_target(), handler)
+    
+    def test_signal_reported_off_main_thread(self):
+        """Test that a shutdown signal is reported by the reporter thread before the main thread exits"""
+        handler = get_error_handler()
+        error_handler._install_crash_reporting(handler)
+        reports = []
+        reported = threading.Event()
+        
+        def record(signum, frame):
+            reports.append((signum, threading.current_thread().name))
+            reported.set()
+        
+        with patch.object(handler, '_handle_system_signal', side_effect=record):
+            with self.assertRaises(SystemExit):
+                signal.raise_signal(signal.SIGTERM)
+                # The handler returns at once; the reporter re-delivers the signal when done
+                self.assertTrue(reported.wait(5))
+                for _ in range(50):
+                    time.sleep(0.1)
+        
+        self.assertEqual(reports, [(signal.SIGTERM, "voice-control-signal-reporter")])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Unit tests for health monitor checks, scheduling and history
+"""
+
+import unittest
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add voice_control to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_control.core.health_monitor import (
+    HealthMonitor, HealthStatus, HealthCheck, HealthCheckSummary, ComponentType, _first_at_or_after
+)
+
+
+class _FakeClock:
+    """Monotonic clock and stop event for driving the monitoring loop without sleeping"""
+    
+    def __init__(self, stop_at: float):
+        self.now = 0.0
+        self.stop_at = stop_at
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def is_set(self) -> bool:
+        return self.now >= self.stop_at
+    
+    def wait(self, timeout: float) -> bool:
+        self.now += timeout
+        return False
+
+
+class TestCpuCheck(unittest.TestCase):
+    """Test CPU usage sampling"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.monitor = HealthMonitor()
+    
+    def test_first_check_after_start_is_unknown(self):
+        """Test that a check right after construction doesn't report the noisy short window"""
+        with patch.object(self.monitor._proc, 'cpu_percent', return_value=2087.9) as cpu_percent:
+            check = self.monitor._check_cpu_usage()
+        
+        self.assertEqual(check.status, HealthStatus.UNKNOWN)
+        cpu_percent.assert_not_called()
+    
+    def test_short_window_reuses_previous_sample(self):
+        """Test that checks within the sample window repeat the last reading"""
+        self.monitor._cpu_sampled_at -= self.monitor.min_cpu_sample_window
+        with patch.object(self.monitor._proc, 'cpu_percent', return_value=12.5):
+            first = self.monitor._check_cpu_usage()
+        with patch.object(self.monitor._proc, 'cpu_percent', return_value=2087.9) as cpu_percent:
+            second = self.monitor._check_cpu_usage()
+        
+        cpu_percent.assert_not_called()
+        self.assertEqual(first.status, HealthStatus.HEALTHY)
+        self.assertEqual(second.details["cpu_percent"], 12.5)
+        self.assertEqual(second.status, HealthStatus.HEALTHY)
+
+
+class TestMonitoringSchedule(unittest.TestCase):
+    """Test per-component polling intervals and the idle back-off"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.monitor = HealthMonitor()
+        self.monitor.check_interval = 30
+    
+    def _run_loop(self, until: float) -> dict:
+        """Run the monitoring loop on a fake clock; returns how often each component was checked"""
+        clock = _FakeClock(until)
+        counts = {component: 0 for component in ComponentType if component in self.monitor._probes}
+        
+        def perform_health_check(components):
+            for component in components:
+                counts[component] += 1
+        
+        self.monitor._stop_event = clock
+        with patch('voice_control.core.health_monitor.time', clock), \
+                patch.object(self.monitor, 'perform_health_check', side_effect=perform_health_check):
+            self.monitor._monitoring_loop()
+        return counts
+    
+    def test_components_checked_on_own_interval(self):
+        """Test that components with their own interval keep to it while others use check_interval"""
+        counts = self._run_loop(600)
+        
+        self.assertEqual(counts[ComponentType.MEMORY_USAGE], 20)
+        self.assertEqual(counts[ComponentType.SPEECH_RECOGNITION], 20)
+        self.assertEqual(counts[ComponentType.AUDIO_SYSTEM], 10)
+        self.assertEqual(counts[ComponentType.SERVICE_STATUS], 5)
+        self.assertEqual(counts[ComponentType.DISK_USAGE], 2)
+    
+    def test_idle_backoff_slows_expensive_checks(self):
+        """Test that expensive checks back off while healthy and unobserved, and cheap ones don't"""
+        self.monitor._overall_status = HealthStatus.HEALTHY
+        counts = self._run_loop(600)
+        
+        self.assertEqual(counts[ComponentType.MEMORY_USAGE], 20)
+        self.assertEqual(counts[ComponentType.CPU_USAGE], 20)
+        self.assertEqual(counts[ComponentType.SPEECH_RECOGNITION], 4)
+        self.assertEqual(counts[ComponentType.AUDIO_SYSTEM], 2)
+        self.assertEqual(counts[ComponentType.SERVICE_STATUS], 1)
+        self.assertEqual(counts[ComponentType.DISK_USAGE], 1)
+    
+    def test_unhealthy_status_keeps_normal_pace(self):
+        """Test that the idle back-off only applies while everything is healthy"""
+        self.monitor._overall_status = HealthStatus.WARNING
+        counts = self._run_loop(600)
+        
+        self.assertEqual(counts[ComponentType.SPEECH_RECOGNITION], 20)
+
+
+class TestProbePool(unittest.TestCase):
+    """Test that probe threads don't outlive monitoring"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.monitor = HealthMonitor()
+        self.monitor._probes = {
+            ComponentType.MEMORY_USAGE: lambda: HealthCheck(ComponentType.MEMORY_USAGE, HealthStatus.HEALTHY, "ok"),
+            ComponentType.DISK_USAGE: lambda: HealthCheck(ComponentType.DISK_USAGE, HealthStatus.HEALTHY, "ok"),
+        }
+    
+    def _probe_threads(self) -> list:
+        return [thread for thread in threading.enumerate() if thread.name.startswith("health-probe")]
+    
+    def test_check_after_stop_leaves_no_threads(self):
+        """Test that a check after stop_monitoring shuts down the threads it used"""
+        self.monitor.start_monitoring(interval=3600)
+        self.monitor.stop_monitoring()
+        
+        checks = self.monitor.perform_health_check()
+        self.assertEqual(set(checks), set(self.monitor._probes))
+        self.assertIsNone(self.monitor._probe_pool)
+        
+        # Threads of a shut-down pool exit on their own; a leaked pool's never do
+        for thread in self._probe_threads():
+            thread.join(timeout=2)
+        self.assertEqual(self._probe_threads(), [])
+
+
+class TestHealthHistory(unittest.TestCase):
+    """Test history summaries and time-window queries"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.monitor = HealthMonitor()
+        self.now = 1700000000.0
+    
+    def _check(self, component: ComponentType, age: float) -> HealthCheck:
+        return HealthCheck(component=component, status=HealthStatus.HEALTHY, message="ok",
+                           details={"age": age}, timestamp=self.now - age)
+    
+    def test_aged_checks_folded_into_summaries(self):
+        """Test that checks older than the detail window keep only component, status and time"""
+        self.monitor.history_detail_window = 100
+        for age in (300, 250, 150, 50, 0):
+            self.monitor._add_to_history(self._check(ComponentType.MEMORY_USAGE, age))
+        
+        self.assertEqual([check.timestamp for check in self.monitor.health_history],
+                         [self.now - 50, self.now])
+        self.assertEqual(list(self.monitor.history_summaries), [
+            HealthCheckSummary(ComponentType.MEMORY_USAGE, HealthStatus.HEALTHY, self.now - age)
+            for age in (300, 250, 150)
+        ])
+    
+    def test_history_cutoff_boundaries(self):
+        """Test that get_health_history includes checks taken exactly at the cutoff and nothing older"""
+        self.monitor.history_detail_window = 1800
+        for age in (3601, 3600, 1801, 1800, 0):
+            self.monitor._add_to_history(self._check(ComponentType.CPU_USAGE, age))
+        self.monitor._add_to_history(self._check(ComponentType.DISK_USAGE, 0))
+        
+        with patch('voice_control.core.health_monitor.time.time', return_value=self.now):
+            history = self.monitor.get_health_history(hours=1)
+            cpu_history = self.monitor.get_health_history(ComponentType.CPU_USAGE, hours=1)
+            everything = self.monitor.get_health_history(hours=24)
+        
+        # The two oldest in range are summaries, the rest detailed checks
+        self.assertEqual(len(history), 5)
+        self.assertEqual([entry["details"] for entry in history],
+                         [None, None, {"age": 1800}, {"age": 0}, {"age": 0}])
+        self.assertEqual(len(cpu_history), 4)
+        self.assertTrue(all(entry["component"] == "cpu_usage" for entry in cpu_history))
+        self.assertEqual(len(everything), 6)
+    
+    def test_first_at_or_after(self):
+        """Test the binary search at the edges of the history"""
+        history = [self._check(ComponentType.CPU_USAGE, age) for age in (30, 20, 20, 10)]
+        
+        self.assertEqual(_first_at_or_after([], self.now), 0)
+        self.assertEqual(_first_at_or_after(history, self.now - 40), 0)
+        self.assertEqual(_first_at_or_after(history, self.now - 20), 1)
+        self.assertEqual(_first_at_or_after(history, self.now - 15), 3)
+        self.assertEqual(_first_at_or_after(history, self.now), 4)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Unit tests for notification queuing and rate limiting
+"""
+
+import unittest
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add voice_control to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_control.gui.notification_manager import (
+    Notification, NotificationManager, NotificationPriority
+)
+
+
+class TestNotificationManager(unittest.TestCase):
+    """Test notification queue ordering and rate limiting"""
+    
+    def setUp(self):
+        """Set up a manager whose queue is only processed by the test"""
+        with patch.object(NotificationManager, '_start_background_processor'), \
+                patch.object(NotificationManager, '_dismissal_loop'):
+            self.manager = NotificationManager()
+    
+    def _show_next(self):
+        """Show the next queued notification and dismiss it so the following one can show"""
+        self.manager._process_queue()
+        shown = self.manager.current_notification
+        self.manager._dismiss_notification(shown)
+        return shown
+    
+    def _drain_titles(self):
+        """Show every queued notification, returning their titles in the order shown"""
+        titles = []
+        while self.manager.notification_queue:
+            titles.append(self._show_next().title)
+        return titles
+    
+    def test_queue_fifo_within_priority(self):
+        """Test that higher priority is shown first and equal priorities keep arrival order"""
+        self.manager.max_notifications_per_window = 10
+        for title, priority in [("n1", NotificationPriority.NORMAL), ("l1", NotificationPriority.LOW),
+                                ("h1", NotificationPriority.HIGH), ("n2", NotificationPriority.NORMAL),
+                                ("l2", NotificationPriority.LOW), ("h2", NotificationPriority.HIGH)]:
+            self.manager._add_to_queue(Notification(title, "", priority=priority))
+        
+        self.assertEqual(self._drain_titles(), ["h1", "h2", "n1", "n2", "l1", "l2"])
+    
+    def test_full_queue_evicts_newest_lowest_priority(self):
+        """Test that a full queue drops its newest lowest-priority notification"""
+        self.manager.max_queue_size = 3
+        for title, priority in [("l1", NotificationPriority.LOW), ("h1", NotificationPriority.HIGH),
+                                ("l2", NotificationPriority.LOW), ("n1", NotificationPriority.NORMAL),
+                                ("c1", NotificationPriority.CRITICAL)]:
+            self.manager._add_to_queue(Notification(title, "", priority=priority))
+        
+        # Adding n1 evicted l2 (newest LOW), adding c1 evicted l1
+        self.assertEqual(self._drain_titles(), ["c1", "h1", "n1"])
+    
+    def test_rate_limit_expires_in_show_order(self):
+        """Test that rate limiting counts notifications from when they were shown"""
+        self.manager.rate_limit_window = 0.5
+        self.manager.max_notifications_per_window = 2
+        
+        # Created low first, but the high priority one is shown first
+        self.manager.show_notification("low", "", priority=NotificationPriority.LOW)
+        self.manager.show_notification("high", "", priority=NotificationPriority.HIGH)
+        self.assertEqual(self._show_next().title, "high")
+        time.sleep(0.3)
+        self.assertEqual(self._show_next().title, "low")
+        
+        shown_at = [shown for shown, _ in self.manager.recent_notifications]
+        self.assertEqual(shown_at, sorted(shown_at))
+        self.assertFalse(self.manager._check_rate_limit())
+        
+        # Only the first one shown has left the window
+        time.sleep(0.3)
+        self.assertTrue(self.manager._check_rate_limit())
+        self.assertEqual([n.title for _, n in self.manager.recent_notifications], ["low"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Unit tests for resource manager monitoring and signal handling
+"""
+
+import unittest
+import gc
+import os
+import sys
+import threading
+import time
+import weakref
+from pathlib import Path
+from unittest.mock import patch
+
+# Add voice_control to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from voice_control.core import resource_manager
+from voice_control.core.resource_manager import ResourceManager
+
+# Keep the test managers out of the permanent GC generation so they can be collected
+_gc_freeze_off = patch.dict(os.environ, {"VC_GC_FREEZE": "0"})
+
+
+def setUpModule():
+    _gc_freeze_off.start()
+
+
+def tearDownModule():
+    _gc_freeze_off.stop()
+
+
+def _counting_pass(counter: list, ran: threading.Event):
+    """Stand-in for _monitoring_pass that records each call"""
+    def monitoring_pass():
+        counter.append(1)
+        ran.set()
+        return True
+    return monitoring_pass
+
+
+class TestSharedMonitoring(unittest.TestCase):
+    """Test that all managers are monitored from one thread"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.managers = []
+    
+    def tearDown(self):
+        """Stop monitoring on every manager the test started"""
+        for manager in self.managers:
+            manager.stop_monitoring()
+    
+    def _monitored_manager(self, interval: float):
+        """Create a manager with a counting pass and start monitoring it"""
+        manager = ResourceManager()
+        manager.passes, manager.ran = [], threading.Event()
+        manager._monitoring_pass = _counting_pass(manager.passes, manager.ran)
+        self.managers.append(manager)
+        manager.start_monitoring(interval)
+        return manager
+    
+    def test_managers_share_one_thread(self):
+        """Test that monitored managers share one thread, which exits when the last stops"""
+        first = self._monitored_manager(60)
+        second = self._monitored_manager(60)
+        
+        self.assertTrue(first.ran.wait(2))
+        self.assertTrue(second.ran.wait(2))
+        thread = first.monitoring_thread
+        self.assertIs(second.monitoring_thread, thread)
+        
+        first.stop_monitoring()
+        self.assertTrue(thread.is_alive())
+        second.stop_monitoring()
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(resource_manager._monitor_thread)
+    
+    def test_new_manager_runs_without_waiting_for_others(self):
+        """Test that starting a manager wakes the shared thread out of a long wait"""
+        first = self._monitored_manager(300)
+        self.assertTrue(first.ran.wait(2))
+        
+        second = self._monitored_manager(300)
+        self.assertTrue(second.ran.wait(2))
+        self.assertEqual(len(first.passes), 1)
+    
+    def test_dropped_manager_is_collected(self):
+        """Test that the shared thread does not keep an unreferenced manager alive"""
+        manager = ResourceManager()
+        ran = threading.Event()
+        manager._monitoring_pass = _counting_pass([], ran)
+        manager.start_monitoring(300)
+        self.assertTrue(ran.wait(2))
+        thread = manager.monitoring_thread
+        
+        manager_ref = weakref.ref(manager)
+        del manager
+        gc.collect()
+        self.assertIsNone(manager_ref())
+        
+        # With nothing left to monitor the thread exits on its next wake-up
+        resource_manager._monitor_wake.set()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+
+
+class TestMonitoringBackoff(unittest.TestCase):
+    """Test scheduling of monitoring passes after failures"""
+    
+    def setUp(self):
+        """Set up a manager whose samples always fail"""
+        self.manager = ResourceManager()
+        self.manager._monitor_interval = 30
+        self.manager._sample = self._failing_sample
+    
+    @staticmethod
+    def _failing_sample(max_age: float = 1.0):
+        raise OSError("/proc unreadable")
+    
+    def _delay_after_pass(self) -> float:
+        """Run one pass that has come due, schedule the next and return how far away it is"""
+        before = self.manager._next_pass = time.monotonic()
+        self.manager._schedule_next_pass(self.manager._monitoring_pass())
+        return self.manager._next_pass - before
+    
+    def test_failures_back_off_exponentially(self):
+        """Test that failing passes double the delay up to the cap, and success resets it"""
+        with self.assertLogs(resource_manager.logger, "ERROR"):
+            delays = [self._delay_after_pass() for _ in range(5)]
+        for delay, expected in zip(delays, [60, 120, 240, 300, 300]):
+            self.assertAlmostEqual(delay, expected, delta=1)
+        self.assertEqual(self.manager._failed_passes, 5)
+        
+        del self.manager._sample
+        self.assertAlmostEqual(self._delay_after_pass(), 30, delta=1)
+        self.assertEqual(self.manager._failed_passes, 0)
+    
+    def test_cap_never_below_interval(self):
+        """Test that an interval longer than the cap is still honoured while failing"""
+        self.manager._monitor_interval = 600
+        with self.assertLogs(resource_manager.logger, "ERROR"):
+            self.assertAlmostEqual(self._delay_after_pass(), 600, delta=1)
+
+
+class TestSignalHandlers(unittest.TestCase):
+    """Test installation of the shutdown signal handler"""
+    
+    def setUp(self):
+        """Pretend no handler has been installed yet"""
+        self._installed = resource_manager._signals_installed
+        resource_manager._signals_installed = False
+    
+    def tearDown(self):
+        """Restore the real installation state"""
+        resource_manager._signals_installed = self._installed
+    
+    def test_installed_once(self):
+        """Test that repeated installs only set the handlers once"""
+        with patch.object(resource_manager.signal, 'signal') as set_handler:
+            self.assertTrue(ResourceManager.install_signal_handlers_from_main_thread())
+            self.assertTrue(ResourceManager.install_signal_handlers_from_main_thread())
+        
+        self.assertEqual(set_handler.call_count, 2)  # SIGTERM and SIGINT, once each
+    
+    def test_not_installed_off_main_thread(self):
+        """Test that installing from a worker thread is refused instead of raising"""
+        results = []
+        with patch.object(resource_manager.signal, 'signal') as set_handler:
+            worker = threading.Thread(
+                target=lambda: results.append(ResourceManager.install_signal_handlers_from_main_thread()))
+            worker.start()
+            worker.join()
+        
+        self.assertEqual(results, [False])
+        set_handler.assert_not_called()
+        self.assertFalse(resource_manager._signals_installed)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -7,19 +7,36 @@ to prevent system hangs and crashes. Enhanced for Debian 12 production readiness
 """
 
 import logging
+import logging.handlers
 import traceback
 import functools
+import asyncio
+import itertools
 import time
 import sys
 import os
 import json
+import queue
+import random
+import atexit
 import signal
+import faulthandler
 import psutil
-from typing import Any, Callable, Dict, List, Optional, Type, Union, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Type, Union, Tuple
+from collections import deque
 from enum import Enum
+from dataclasses import dataclass
 from pathlib import Path
 import threading
-from datetime import datetime, timedelta
+import weakref
+from contextvars import ContextVar
+from datetime import datetime
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -41,14 +58,135 @@ class RecoveryAction(Enum):
     SHUTDOWN = "shutdown"
 
 
+# Signal number -> name, built once so crash paths don't construct Signals members
+_SIGNAL_NAMES: Dict[int, str] = {sig.value: sig.name for sig in signal.Signals}
+
+
+# Logging level used for each error severity
+_SEV_TO_LEVEL: Dict[ErrorSeverity, int] = {
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+    ErrorSeverity.HIGH: logging.ERROR,
+    ErrorSeverity.MEDIUM: logging.WARNING,
+    ErrorSeverity.LOW: logging.INFO,
+}
+
+
+def _format_error_key(error_key: Tuple[type, str]) -> str:
+    """Render an (error_type, context) key as 'ErrorType:context' for reports"""
+    return f"{error_key[0].__name__}:{error_key[1]}"
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles these
+            pass
+    
+    if indent:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(',', ':'), default=str)
+
+
+class _JsonMessage:
+    """Log message that serializes its payload to one-line JSON only when formatted"""
+    __slots__ = ('payload',)
+    
+    def __init__(self, payload: Dict[str, Any]):
+        self.payload = payload
+    
+    def __str__(self) -> str:
+        return _json_dumps(self.payload)
+
+
+class _DeferredTraceback:
+    """Stack trace captured when an error is recorded and rendered only when the log record is written"""
+    __slots__ = ('exception',)
+    
+    def __init__(self, exception: traceback.TracebackException):
+        self.exception = exception
+    
+    def __str__(self) -> str:
+        return ''.join(self.exception.format())
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _IdleFlushQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers whenever the queue goes idle"""
+    idle_flush_interval = 1.0
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                return self.queue.get(block, self.idle_flush_interval)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
+
+
+class _ErrorPool(threading.local):
+    """Per-thread free lists of reusable error instances, keyed by error class"""
+    max_size = 64
+    
+    def __init__(self):
+        self.free: Dict[type, List["VoiceControlError"]] = {}
+
+
+_error_pool = _ErrorPool()
+
+
 class VoiceControlError(Exception):
     """Base exception for voice control application"""
+    # Class-level defaults let getattr() lookups resolve on the type
+    severity = ErrorSeverity.MEDIUM
+    recovery_action = RecoveryAction.RETRY
+    
     def __init__(self, message: str, severity: ErrorSeverity = ErrorSeverity.MEDIUM, 
                  recovery_action: RecoveryAction = RecoveryAction.RETRY):
         super().__init__(message)
         self.severity = severity
         self.recovery_action = recovery_action
         self.timestamp = time.time()
+    
+    @classmethod
+    def acquire(cls, message: str, severity: ErrorSeverity = ErrorSeverity.MEDIUM,
+                recovery_action: RecoveryAction = RecoveryAction.RETRY) -> "VoiceControlError":
+        """Get a pooled instance for a transient error that is handled internally.
+        
+        Only use this for errors that never escape to user code, and call
+        release() once the error has been handled.
+        """
+        free = _error_pool.free.get(cls)
+        if not free:
+            return cls(message, severity, recovery_action)
+        
+        error = free.pop()
+        error.args = (message,)
+        error.severity = severity
+        error.recovery_action = recovery_action
+        error.timestamp = time.time()
+        return error
+    
+    def release(self):
+        """Return a pooled instance to the current thread's free list"""
+        self.__traceback__ = None
+        self.__context__ = None
+        self.__cause__ = None
+        
+        free = _error_pool.free.setdefault(type(self), [])
+        if len(free) < _error_pool.max_size:
+            free.append(self)
 
 
 class AudioError(VoiceControlError):
@@ -71,6 +209,32 @@ class ConfigurationError(VoiceControlError):
     pass
 
 
+@dataclass
+class ErrorSummary:
+    """Lightweight record of a handled error kept in the in-memory history"""
+    __slots__ = ('timestamp', 'error_type', 'error_message', 'context',
+                 'severity', 'recovery_action', 'recovery_success')
+    timestamp: float  # Epoch seconds; formatted as ISO 8601 only for output
+    error_type: str
+    error_message: str
+    context: str
+    severity: str
+    recovery_action: str
+    recovery_success: bool
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            'timestamp': datetime.fromtimestamp(self.timestamp).isoformat(),
+            'error_type': self.error_type,
+            'error_message': self.error_message,
+            'context': self.context,
+            'severity': self.severity,
+            'recovery_action': self.recovery_action,
+            'recovery_success': self.recovery_success
+        }
+
+
 class SystemMonitor:
     """Monitor system resources and health"""
     
@@ -82,59 +246,100 @@ class SystemMonitor:
         self.memory_threshold = 500 * 1024 * 1024  # 500MB
         self.cpu_threshold = 80.0  # 80%
         
+        # Cached results of the more expensive probes: key -> (timestamp, value)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # Last combined probe: (timestamp, stats, warnings)
+        self.probe_ttl = 1.0
+        self._last_probe: Optional[Tuple[float, Dict[str, Any], List[str]]] = None
+        
+        # Prime CPU sampling so later non-blocking calls return a real delta
+        psutil.cpu_percent(interval=None)
+        if self.process:
+            try:
+                self.process.cpu_percent(interval=None)
+            except Exception:
+                pass
+        self._last_cpu_sample = time.monotonic()
+    
+    def _cached(self, key: str, ttl: float, probe: Callable[[], Any]) -> Any:
+        """Return a cached probe result, refreshing it once it is older than ttl seconds"""
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        value = probe()
+        self._cache[key] = (now, value)
+        return value
+    
     def get_system_stats(self) -> Dict[str, Any]:
         """Get current system statistics"""
-        try:
-            if not self.process:
-                return {}
-                
-            return {
-                'memory_usage': self.process.memory_info().rss,
-                'memory_percent': self.process.memory_percent(),
-                'cpu_percent': self.process.cpu_percent(),
-                'num_threads': self.process.num_threads(),
-                'open_files': len(self.process.open_files()),
-                'connections': len(self.process.connections()),
-                'system_memory': psutil.virtual_memory()._asdict(),
-                'system_cpu': psutil.cpu_percent(interval=1),
-                'disk_usage': psutil.disk_usage('/')._asdict()
-            }
-        except Exception as e:
-            logger.error(f"Failed to get system stats: {e}")
-            return {}
+        return self._probe()[0]
     
     def check_resource_limits(self) -> List[str]:
         """Check if resource limits are exceeded"""
-        warnings = []
+        return self._probe()[1]
+    
+    def _probe(self) -> Tuple[Dict[str, Any], List[str]]:
+        """Collect system statistics and resource warnings from one batch of reads.
         
-        try:
-            if not self.process:
-                return warnings
+        Results are reused for probe_ttl seconds so a burst of errors costs a
+        single set of /proc reads.
+        """
+        now = time.monotonic()
+        last_probe = self._last_probe
+        if last_probe is not None and now - last_probe[0] < self.probe_ttl:
+            return last_probe[1], last_probe[2]
+        
+        stats: Dict[str, Any] = {}
+        warnings: List[str] = []
+        
+        if self.process:
+            try:
+                # Batch the /proc/<pid>/stat and status reads shared by these calls
+                with self.process.oneshot():
+                    stats['memory_usage'] = self.process.memory_info().rss
+                    stats['memory_percent'] = self.process.memory_percent()
+                    stats['cpu_percent'] = self.process.cpu_percent(interval=None)
+                    stats['num_threads'] = self.process.num_threads()
                 
-            # Check memory usage
-            memory_usage = self.process.memory_info().rss
-            if memory_usage > self.memory_threshold:
-                warnings.append(f"High memory usage: {memory_usage / 1024 / 1024:.1f}MB")
-            
-            # Check CPU usage
-            cpu_percent = self.process.cpu_percent()
-            if cpu_percent > self.cpu_threshold:
-                warnings.append(f"High CPU usage: {cpu_percent:.1f}%")
-            
-            # Check system memory
-            system_memory = psutil.virtual_memory()
-            if system_memory.percent > 90:
-                warnings.append(f"System memory critical: {system_memory.percent:.1f}%")
-            
-            # Check disk space
-            disk_usage = psutil.disk_usage('/')
-            if disk_usage.percent > 95:
-                warnings.append(f"Disk space critical: {disk_usage.percent:.1f}%")
+                # Non-blocking CPU readings average over the time since the previous sample,
+                # so flag readings that cover a long gap rather than blocking for a fresh one
+                stats['cpu_percent_stale'] = now - self._last_cpu_sample > 5.0
+                self._last_cpu_sample = now
                 
-        except Exception as e:
-            warnings.append(f"Resource monitoring error: {e}")
+                system_memory = self._cached('virtual_memory', 1.0, psutil.virtual_memory)
+                disk_usage = self._cached('disk_usage', 30.0, lambda: psutil.disk_usage('/'))
+                stats['open_files'] = len(self.process.open_files())
+                stats['connections'] = self._cached('connections', 10.0, lambda: len(self.process.connections()))
+                stats['system_memory'] = system_memory._asdict()
+                stats['system_cpu'] = self._cached('system_cpu', 2.0, lambda: psutil.cpu_percent(interval=None))
+                stats['disk_usage'] = disk_usage._asdict()
+                
+                # Check memory usage
+                if stats['memory_usage'] > self.memory_threshold:
+                    warnings.append(f"High memory usage: {stats['memory_usage'] / 1024 / 1024:.1f}MB")
+                
+                # Check CPU usage
+                if stats['cpu_percent'] > self.cpu_threshold:
+                    warnings.append(f"High CPU usage: {stats['cpu_percent']:.1f}%")
+                
+                # Check system memory
+                if system_memory.percent > 90:
+                    warnings.append(f"System memory critical: {system_memory.percent:.1f}%")
+                
+                # Check disk space
+                if disk_usage.percent > 95:
+                    warnings.append(f"Disk space critical: {disk_usage.percent:.1f}%")
+                    
+            except Exception as e:
+                logger.error(f"Failed to get system stats: {e}")
+                stats = {}
+                warnings.append(f"Resource monitoring error: {e}")
         
-        return warnings
+        self._last_probe = (now, stats, warnings)
+        return stats, warnings
 
 
 class CrashDetector:
@@ -143,22 +348,38 @@ class CrashDetector:
     def __init__(self):
         self.crash_indicators = []
         self.last_crash_time = None
+        try:
+            self.process = psutil.Process()
+        except Exception:
+            self.process = None
+        
+        # Static details are captured once here rather than copied on every crash
+        self._env_snapshot = dict(os.environ)
+        self._python_info = {
+            'version': sys.version,
+            'executable': sys.executable,
+            'path': sys.path[:10]  # Limit path length
+        }
+        if hasattr(os, 'uname'):
+            uname = os.uname()
+            self._architecture = {
+                field: getattr(uname, field)
+                for field in ('sysname', 'nodename', 'release', 'version', 'machine')
+            }
+        else:
+            self._architecture = {}
         
     def collect_crash_info(self, signum: int, frame) -> Dict[str, Any]:
         """Collect detailed crash information"""
         crash_info = {
             'timestamp': datetime.now().isoformat(),
             'signal': signum,
-            'signal_name': signal.Signals(signum).name if signum in signal.Signals._value2member_map_ else f"Signal-{signum}",
+            'signal_name': _SIGNAL_NAMES.get(signum, "Signal-%d" % signum),
             'process_info': self._get_process_info(),
             'system_info': self._get_system_info(),
             'stack_trace': self._get_stack_trace(frame),
-            'environment': dict(os.environ),
-            'python_info': {
-                'version': sys.version,
-                'executable': sys.executable,
-                'path': sys.path[:10]  # Limit path length
-            }
+            'environment': self._env_snapshot,
+            'python_info': self._python_info
         }
         
         return crash_info
@@ -166,15 +387,23 @@ class CrashDetector:
     def _get_process_info(self) -> Dict[str, Any]:
         """Get current process information"""
         try:
-            process = psutil.Process()
+            process = self.process
+            if process is None:
+                return {'error': 'process information unavailable'}
+            
+            with process.oneshot():
+                info = {
+                    'pid': process.pid,
+                    'ppid': process.ppid(),
+                    'name': process.name(),
+                    'cmdline': process.cmdline(),
+                    'memory_info': process.memory_info()._asdict(),
+                    'cpu_times': process.cpu_times()._asdict(),
+                    'num_threads': process.num_threads(),
+                }
+            
             return {
-                'pid': process.pid,
-                'ppid': process.ppid(),
-                'name': process.name(),
-                'cmdline': process.cmdline(),
-                'memory_info': process.memory_info()._asdict(),
-                'cpu_times': process.cpu_times()._asdict(),
-                'num_threads': process.num_threads(),
+                **info,
                 'open_files': [f.path for f in process.open_files()],
                 'connections': len(process.connections())
             }
@@ -186,7 +415,7 @@ class CrashDetector:
         try:
             return {
                 'platform': sys.platform,
-                'architecture': os.uname()._asdict() if hasattr(os, 'uname') else {},
+                'architecture': self._architecture,
                 'memory': psutil.virtual_memory()._asdict(),
                 'cpu_count': psutil.cpu_count(),
                 'boot_time': psutil.boot_time(),
@@ -214,16 +443,163 @@ class CrashDetector:
             return [f"Stack trace error: {e}"]
 
 
+# The "voice_control.errors" logger and its writer thread are shared by every handler
+_error_log_setup_lock = threading.Lock()
+_error_log_listener: Optional[_IdleFlushQueueListener] = None
+
+
+def _install_error_logging(log_file: Path) -> logging.Logger:
+    """Route the error logger to log_file through a background writer, once per process"""
+    global _error_log_listener
+    error_logger = logging.getLogger("voice_control.errors")
+    with _error_log_setup_lock:
+        if _error_log_listener is not None:
+            return error_logger
+        
+        # Create file handler for errors
+        file_handler = logging.handlers.WatchedFileHandler(log_file)
+        file_handler.setLevel(logging.ERROR)
+        
+        # Create detailed formatter
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+        )
+        file_handler.setFormatter(formatter)
+        
+        # Buffer writes in batches; critical records and idle periods flush immediately
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=256, flushLevel=logging.CRITICAL, target=file_handler
+        )
+        
+        # Serialize and write records on a background thread so error paths only enqueue
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _error_log_listener = _IdleFlushQueueListener(log_queue, buffered_handler)
+        _error_log_listener.start()
+        atexit.register(buffered_handler.close)
+        atexit.register(_error_log_listener.stop)
+        
+        queue_handler = _DeferredQueueHandler(log_queue)
+        queue_handler.setLevel(logging.ERROR)
+        
+        error_logger.addHandler(queue_handler)
+        error_logger.setLevel(logging.ERROR)
+    return error_logger
+
+
+# Crash reporting plumbing is process-wide: faulthandler and the signal handlers are
+# global, so the crash log descriptor, wake-up pipe and reporter thread are set up once
+# and shared by every ProductionErrorHandler. The most recently created handler reports.
+_signal_setup_lock = threading.Lock()
+_crash_fd: Optional[int] = None
+_signal_pipe: Optional[Tuple[int, int]] = None
+_signal_target: Optional["weakref.ref[ProductionErrorHandler]"] = None
+_signal_frame = None
+_signal_pending = False
+
+
+def _forward_signal(signum, frame):
+    """SIGTERM/SIGINT handler: wake the reporter thread, then return to the interrupted code
+    
+    Nothing here waits on the reporter, which may need a lock the interrupted main thread
+    holds. Once the report is written the reporter delivers the signal again, and this
+    handler then exits the main thread.
+    """
+    global _signal_frame, _signal_pending
+    if _signal_pending:
+        # Reporter finished, or a repeated signal asks to stop without waiting for it
+        sys.exit(1)
+    _signal_pending = True
+    
+    # Hard deadline in case reporting or cleanup hangs
+    signal.alarm(10)
+    _signal_frame = frame
+    try:
+        os.write(_signal_pipe[1], bytes((signum,)))
+    except OSError:
+        sys.exit(1)
+
+
+def _signal_reporter_loop(read_fd: int):
+    """Report signals forwarded by _forward_signal, then hand the exit back to the main thread"""
+    while True:
+        try:
+            data = os.read(read_fd, 1)
+        except OSError:
+            return
+        if not data:
+            return
+        
+        handler = _signal_target() if _signal_target is not None else None
+        try:
+            if handler is not None:
+                handler._handle_system_signal(data[0], _signal_frame)
+        finally:
+            signal.pthread_kill(threading.main_thread().ident, data[0])
+
+
+def _install_crash_reporting(handler: "ProductionErrorHandler"):
+    """Point crash reporting at handler, setting up the process-wide pieces on first use"""
+    global _crash_fd, _signal_pipe, _signal_target
+    with _signal_setup_lock:
+        _signal_target = weakref.ref(handler)
+        
+        # Fatal signals (SIGABRT, SIGSEGV, ...) are reported by faulthandler, which
+        # only uses async-signal-safe writes to the pre-opened crash log descriptor
+        if _crash_fd is None:
+            try:
+                _crash_fd = os.open(handler.fatal_signal_log_file,
+                                    os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                faulthandler.enable(file=_crash_fd, all_threads=True)
+            except (OSError, ValueError, RuntimeError) as e:
+                logger.warning(f"Failed to enable fatal signal reporting: {e}")
+        
+        if _signal_pipe is not None:
+            return
+        
+        # Shutdown signals only wake the reporter thread through a pipe; crash info
+        # collection, logging and cleanup all happen outside the signal handler
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(write_fd, False)
+        _signal_pipe = (read_fd, write_fd)
+        
+        installed = False
+        for sig in [signal.SIGTERM, signal.SIGINT]:
+            try:
+                signal.signal(sig, _forward_signal)
+                installed = True
+            except (OSError, ValueError):
+                # Some signals may not be available on all systems, and handlers
+                # can only be installed from the main thread
+                pass
+        
+        if not installed:
+            # Retried by the next handler created on the main thread
+            _signal_pipe = None
+            os.close(read_fd)
+            os.close(write_fd)
+            return
+        
+        threading.Thread(target=_signal_reporter_loop, args=(read_fd,),
+                         name="voice-control-signal-reporter", daemon=True).start()
+
+
 class ProductionErrorHandler:
     """Production-ready comprehensive error handling and recovery system"""
     
     def __init__(self):
-        self.error_counts: Dict[str, int] = {}
-        self.last_errors: Dict[str, float] = {}
+        # Error stats and fallback handlers are allocated on first use; most runs never need them
+        self._stats: Optional[Dict[Tuple[type, str], list]] = None  # (error_type, context) -> [count, last_timestamp]
+        
+        # Published statistics snapshot: (generation, built_at, statistics). The generation
+        # comes from itertools.count, whose next() is atomic, so concurrent updates never
+        # publish the same value twice
+        self._stats_generations = itertools.count()
+        self._stats_generation = next(self._stats_generations)
+        self._stats_snapshot: Optional[Tuple[int, float, Dict[str, Any]]] = None
         self.recovery_handlers: Dict[Type[Exception], Callable] = {}
-        self.fallback_handlers: Dict[str, Callable] = {}
-        self.component_states: Dict[str, str] = {}  # Track component health
-        self.error_history: List[Dict[str, Any]] = []  # Detailed error history
+        self._handler_chain: Tuple[Tuple[Type[Exception], Callable], ...] = ()
+        self.fallback_handlers: Optional[Dict[str, Callable]] = None
+        self.component_states: Dict[str, str] = {}  # Track component health (replaced, never mutated)
         
         # Configuration
         self.max_retries = 3
@@ -232,6 +608,18 @@ class ProductionErrorHandler:
         self.time_window = 300  # 5 minutes
         self.max_error_history = 1000
         
+        # Detailed error history, bounded to the most recent max_error_history records
+        self.error_history: Deque[ErrorSummary] = deque(maxlen=self.max_error_history)
+        
+        # Recovery action dispatch table
+        self._action_dispatch: Dict[RecoveryAction, Callable[[Exception, str], bool]] = {
+            RecoveryAction.RETRY: self._retry_operation,
+            RecoveryAction.FALLBACK: lambda error, context: self._use_fallback(context),
+            RecoveryAction.RESTART_COMPONENT: lambda error, context: self._restart_component(context),
+            RecoveryAction.GRACEFUL_DEGRADATION: lambda error, context: self._graceful_degradation(context),
+            RecoveryAction.SHUTDOWN: self._graceful_shutdown,
+        }
+        
         # Threading
         self._lock = threading.Lock()
         self._shutdown_event = threading.Event()
@@ -243,6 +631,16 @@ class ProductionErrorHandler:
         # Error logging
         self.error_log_dir = Path.home() / ".local/share/voice-control/logs/errors"
         self.error_log_dir.mkdir(parents=True, exist_ok=True)
+        self.error_log_file = self.error_log_dir / f"errors_{datetime.now().strftime('%Y%m%d')}.log"
+        self.fatal_signal_log_file = self.error_log_dir / "fatal_signals.log"
+        
+        # Optional components attached by the application after construction
+        self.audio_manager: Optional[Any] = None
+        self.config_manager: Optional[Any] = None
+        self.feature_manager: Optional[Any] = None
+        self.resource_manager: Optional[Any] = None
+        self.system_tray: Optional[Any] = None
+        self.error_logger: Optional[logging.Logger] = None
         
         # Initialize components
         self._setup_error_logging()
@@ -254,44 +652,22 @@ class ProductionErrorHandler:
     def _setup_error_logging(self):
         """Setup detailed error logging"""
         try:
-            # Create error-specific logger
-            self.error_logger = logging.getLogger("voice_control.errors")
-            
-            # Create file handler for errors
-            error_log_file = self.error_log_dir / f"errors_{datetime.now().strftime('%Y%m%d')}.log"
-            file_handler = logging.FileHandler(error_log_file)
-            file_handler.setLevel(logging.ERROR)
-            
-            # Create detailed formatter
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-            )
-            file_handler.setFormatter(formatter)
-            
-            self.error_logger.addHandler(file_handler)
-            self.error_logger.setLevel(logging.ERROR)
-            
+            self.error_logger = _install_error_logging(self.error_log_file)
         except Exception as e:
             logger.warning(f"Failed to setup error logging: {e}")
     
     def _setup_signal_handlers(self):
         """Setup signal handlers for crash detection"""
-        def signal_handler(signum, frame):
-            self._handle_system_signal(signum, frame)
-        
-        # Handle critical signals
-        for sig in [signal.SIGTERM, signal.SIGINT, signal.SIGABRT]:
-            try:
-                signal.signal(sig, signal_handler)
-            except (OSError, ValueError):
-                # Some signals may not be available on all systems
-                pass
+        _install_crash_reporting(self)
     
     def _handle_system_signal(self, signum, frame):
         """Handle system signals that indicate crashes or shutdowns"""
-        signal_name = signal.Signals(signum).name if signum in signal.Signals._value2member_map_ else f"Signal-{signum}"
+        signal_name = _SIGNAL_NAMES.get(signum, "Signal-%d" % signum)
         logger.critical(f"Received signal {signal_name} ({signum})")
         
+        # Wake any decorated operations sleeping between retries
+        request_shutdown()
+        
         # Log crash information
         crash_info = self.crash_detector.collect_crash_info(signum, frame)
         self._log_crash_info(crash_info)
@@ -304,7 +680,7 @@ class ProductionErrorHandler:
         try:
             crash_log_file = self.error_log_dir / f"crash_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             with open(crash_log_file, 'w') as f:
-                json.dump(crash_info, f, indent=2, default=str)
+                f.write(_json_dumps(crash_info, indent=True))
             
             logger.critical(f"Crash information saved to {crash_log_file}")
             
@@ -357,7 +733,7 @@ class ProductionErrorHandler:
         """Emergency cleanup of GUI resources"""
         try:
             # Try to cleanup GUI resources
-            if hasattr(self, 'system_tray') and self.system_tray:
+            if self.system_tray is not None:
                 self.system_tray._exit_application()
         except Exception:
             pass
@@ -368,13 +744,13 @@ class ProductionErrorHandler:
             state_file = self.error_log_dir / "last_error_state.json"
             state = {
                 'timestamp': datetime.now().isoformat(),
-                'error_counts': self.error_counts,
+                'error_counts': self.get_error_statistics()['error_counts'],
                 'component_states': self.component_states,
-                'recent_errors': self.error_history[-10:] if self.error_history else []
+                'recent_errors': [summary.to_dict() for summary in list(self.error_history)[-10:]]
             }
             
             with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2, default=str)
+                f.write(_json_dumps(state, indent=True))
                 
         except Exception as e:
             logger.error(f"Failed to save error state: {e}")
@@ -389,76 +765,95 @@ class ProductionErrorHandler:
     def register_recovery_handler(self, error_type: Type[Exception], handler: Callable):
         """Register a recovery handler for a specific error type"""
         self.recovery_handlers[error_type] = handler
+        
+        # Most derived types first, so the first isinstance match is the most specific handler
+        self._handler_chain = tuple(sorted(
+            self.recovery_handlers.items(), key=lambda item: len(item[0].__mro__), reverse=True
+        ))
         logger.debug(f"Registered recovery handler for {error_type.__name__}")
     
     def register_fallback_handler(self, component: str, handler: Callable):
         """Register a fallback handler for a component"""
+        if self.fallback_handlers is None:
+            self.fallback_handlers = {}
         self.fallback_handlers[component] = handler
         logger.debug(f"Registered fallback handler for {component}")
     
     def handle_error(self, error: Exception, context: str = "") -> bool:
-        """Handle an error with appropriate recovery action"""
-        error_key = f"{type(error).__name__}:{context}"
+        """Handle an error with appropriate recovery action
         
-        with self._lock:
-            # Track error frequency
-            self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
-            self.last_errors[error_key] = time.time()
-            
-            # Check if we're hitting too many errors
-            if self._is_error_threshold_exceeded(error_key):
-                logger.critical(f"Error threshold exceeded for {error_key}")
-                return self._handle_critical_error(error, context)
+        Without a context, the error is attributed to the component of the enclosing
+        critical_operation, if any.
+        """
+        if not context:
+            context = current_component.get()
+        error_key = (type(error), context)
+        now = time.time()
         
-        # Log the error
-        self._log_error(error, context)
+        # Track error frequency without taking the lock: setdefault and the
+        # per-item list updates are each atomic under the GIL, and readers
+        # tolerate seeing a count and timestamp from different updates. Work on a
+        # local, since reset_error_counts may drop the dict meanwhile
+        stats = self._stats
+        if stats is None:
+            with self._lock:
+                stats = self._stats
+                if stats is None:
+                    stats = self._stats = {}
+        entry = stats.setdefault(error_key, [0, now])
+        if now - entry[1] > self.time_window:
+            entry[0] = 1
+        else:
+            entry[0] += 1
+        entry[1] = now
+        self._stats_generation = next(self._stats_generations)
         
-        # Try to recover
-        recovery_success = self._attempt_recovery(error, context)
+        # Check if we're hitting too many errors
+        if entry[0] >= self.error_threshold:
+            logger.critical(f"Error threshold exceeded for {_format_error_key(error_key)}")
+            recovery_success = self._handle_critical_error(error, context)
+        else:
+            # Log the error
+            self._log_error(error, context)
+            
+            # Try to recover
+            recovery_success = self._attempt_recovery(error, context)
         
         # Add to error history
         self.add_error_to_history(error, context, recovery_success)
         
         return recovery_success
     
-    def _is_error_threshold_exceeded(self, error_key: str) -> bool:
-        """Check if error threshold is exceeded"""
-        count = self.error_counts.get(error_key, 0)
-        last_time = self.last_errors.get(error_key, 0)
-        current_time = time.time()
+    def record_component_failure(self, error: Exception, context: str, state: str) -> bool:
+        """Move a component to a failure state and handle the error that caused it
         
-        # Reset count if outside time window
-        if current_time - last_time > self.time_window:
-            self.error_counts[error_key] = 1
-            return False
-        
-        return count >= self.error_threshold
+        The error is recovered from and recorded in history exactly once, by handle_error.
+        """
+        self.set_component_state(context, state)
+        return self.handle_error(error, context)
     
     def _log_error(self, error: Exception, context: str):
         """Log error with appropriate level"""
-        severity = getattr(error, 'severity', ErrorSeverity.MEDIUM)
+        level = _SEV_TO_LEVEL.get(getattr(error, 'severity', ErrorSeverity.MEDIUM), logging.INFO)
         
-        error_msg = f"Error in {context}: {str(error)}"
+        # Skip message formatting and traceback capture if the record would be discarded
+        if not logger.isEnabledFor(level):
+            return
         
-        if severity == ErrorSeverity.CRITICAL:
-            logger.critical(error_msg, exc_info=True)
-        elif severity == ErrorSeverity.HIGH:
-            logger.error(error_msg, exc_info=True)
-        elif severity == ErrorSeverity.MEDIUM:
-            logger.warning(error_msg)
-        else:
-            logger.info(error_msg)
+        logger.log(level, f"Error in {context}: {str(error)}", exc_info=(level >= logging.ERROR))
     
     def _attempt_recovery(self, error: Exception, context: str) -> bool:
         """Attempt to recover from an error"""
         error_type = type(error)
         
-        # Try specific recovery handler
-        if error_type in self.recovery_handlers:
-            try:
-                return self.recovery_handlers[error_type](error, context)
-            except Exception as recovery_error:
-                logger.error(f"Recovery handler failed: {recovery_error}")
+        # Try the most specific recovery handler for the error type or one of its bases
+        for handled_type, handler in self._handler_chain:
+            if isinstance(error, handled_type):
+                try:
+                    return handler(error, context)
+                except Exception as recovery_error:
+                    logger.error(f"Recovery handler failed: {recovery_error}")
+                break
         
         # Try generic recovery based on error attributes
         if hasattr(error, 'recovery_action'):
@@ -471,19 +866,11 @@ class ProductionErrorHandler:
     def _execute_recovery_action(self, action: RecoveryAction, error: Exception, context: str) -> bool:
         """Execute a specific recovery action"""
         try:
-            if action == RecoveryAction.RETRY:
-                return self._retry_operation(error, context)
-            elif action == RecoveryAction.FALLBACK:
-                return self._use_fallback(context)
-            elif action == RecoveryAction.RESTART_COMPONENT:
-                return self._restart_component(context)
-            elif action == RecoveryAction.GRACEFUL_DEGRADATION:
-                return self._graceful_degradation(context)
-            elif action == RecoveryAction.SHUTDOWN:
-                return self._graceful_shutdown(error, context)
-            else:
+            action_handler = self._action_dispatch.get(action)
+            if action_handler is None:
                 logger.warning(f"Unknown recovery action: {action}")
                 return False
+            return action_handler(error, context)
         except Exception as e:
             logger.error(f"Recovery action {action} failed: {e}")
             return False
@@ -494,7 +881,7 @@ class ProductionErrorHandler:
         
         # Try to reinitialize audio system
         try:
-            if hasattr(self, 'audio_manager'):
+            if self.audio_manager is not None:
                 self.audio_manager.reinitialize()
                 return True
         except Exception as e:
@@ -528,7 +915,7 @@ class ProductionErrorHandler:
         
         # Try to reset to default configuration
         try:
-            if hasattr(self, 'config_manager'):
+            if self.config_manager is not None:
                 self.config_manager.reset_to_defaults()
                 return True
         except Exception as e:
@@ -556,7 +943,7 @@ class ProductionErrorHandler:
     
     def _use_fallback(self, component: str) -> bool:
         """Use fallback handler for a component"""
-        if component in self.fallback_handlers:
+        if self.fallback_handlers and component in self.fallback_handlers:
             try:
                 self.fallback_handlers[component]()
                 logger.info(f"Successfully used fallback for {component}")
@@ -579,7 +966,7 @@ class ProductionErrorHandler:
         logger.info(f"Gracefully degrading functionality for {context}")
         
         # Disable non-essential features
-        if hasattr(self, 'feature_manager'):
+        if self.feature_manager is not None:
             self.feature_manager.disable_non_essential()
         
         return True
@@ -589,7 +976,7 @@ class ProductionErrorHandler:
         logger.critical(f"Initiating graceful shutdown due to {context}: {error}")
         
         # Cleanup resources
-        if hasattr(self, 'resource_manager'):
+        if self.resource_manager is not None:
             self.resource_manager.cleanup_all()
         
         # This should trigger application shutdown
@@ -603,76 +990,125 @@ class ProductionErrorHandler:
         return self._graceful_degradation(context)
     
     def get_error_statistics(self) -> Dict[str, Any]:
-        """Get error statistics"""
-        with self._lock:
-            return {
-                'error_counts': dict(self.error_counts),
-                'recent_errors': {
-                    k: v for k, v in self.last_errors.items()
-                    if time.time() - v < self.time_window
-                },
-                'total_errors': sum(self.error_counts.values()),
-                'error_types': len(self.error_counts)
-            }
+        """Get error statistics.
+        
+        The result is a shared snapshot that is rebuilt only after new errors are
+        recorded or once it is a second old, so callers must not modify it.
+        """
+        now = time.time()
+        generation = self._stats_generation
+        snapshot = self._stats_snapshot
+        if snapshot is not None and snapshot[0] == generation and now - snapshot[1] < 1.0:
+            return snapshot[2]
+        
+        # Lock-free: handle_error updates the table without the lock, and list()
+        # snapshots and dict.pop are atomic under the GIL
+        cutoff = now - self.time_window
+        stats = self._stats or {}
+        
+        # Drop keys idle for two windows so long-running daemons don't accumulate them
+        stale_cutoff = now - 2 * self.time_window
+        items = list(stats.items())
+        for key, value in items:
+            if value[1] < stale_cutoff:
+                stats.pop(key, None)
+        
+        error_counts = {}
+        recent_errors = {}
+        total_errors = 0
+        for key, (count, last_time) in items:
+            if last_time < stale_cutoff:
+                continue
+            name = _format_error_key(key)
+            error_counts[name] = count
+            total_errors += count
+            if last_time >= cutoff:
+                recent_errors[name] = last_time
+        
+        statistics = {
+            'error_counts': error_counts,
+            'recent_errors': recent_errors,
+            'total_errors': total_errors,
+            'error_types': len(error_counts)
+        }
+        self._stats_snapshot = (generation, now, statistics)
+        return statistics
     
     def add_error_to_history(self, error: Exception, context: str, recovery_success: bool):
         """Add error to detailed history"""
-        with self._lock:
-            error_record = {
-                'timestamp': datetime.now().isoformat(),
-                'error_type': type(error).__name__,
-                'error_message': str(error),
-                'context': context,
-                'severity': getattr(error, 'severity', ErrorSeverity.MEDIUM).value,
-                'recovery_action': getattr(error, 'recovery_action', RecoveryAction.RETRY).value,
-                'recovery_success': recovery_success,
-                'stack_trace': traceback.format_exc(),
-                'system_stats': self.system_monitor.get_system_stats(),
-                'resource_warnings': self.system_monitor.check_resource_limits()
-            }
-            
-            self.error_history.append(error_record)
-            
-            # Limit history size
-            if len(self.error_history) > self.max_error_history:
-                self.error_history = self.error_history[-self.max_error_history:]
-            
-            # Log to error logger
-            if hasattr(self, 'error_logger'):
-                self.error_logger.error(json.dumps(error_record, indent=2, default=str))
+        # Snapshot the error's own traceback without reading source lines; the log
+        # writer thread renders it. Errors that were never raised have none to capture
+        tb = error.__traceback__
+        stack_trace = None
+        if tb is not None and self.error_logger is not None:
+            stack_trace = _DeferredTraceback(
+                traceback.TracebackException(type(error), error, tb, lookup_lines=False))
+        system_stats, resource_warnings = self.system_monitor._probe()
+        
+        summary = ErrorSummary(
+            timestamp=time.time(),
+            error_type=type(error).__name__,
+            error_message=str(error),
+            context=context,
+            severity=getattr(error, 'severity', ErrorSeverity.MEDIUM).value,
+            recovery_action=getattr(error, 'recovery_action', RecoveryAction.RETRY).value,
+            recovery_success=recovery_success
+        )
+        
+        # deque.append on a bounded deque is atomic, so writers never contend here
+        self.error_history.append(summary)
+        
+        # The full record with stack trace and system state only goes to the error log,
+        # and is formatted and serialized on the log writer thread
+        if self.error_logger is not None:
+            error_record = summary.to_dict()
+            error_record['stack_trace'] = stack_trace
+            error_record['system_stats'] = system_stats
+            error_record['resource_warnings'] = resource_warnings
+            self.error_logger.error(_JsonMessage(error_record))
     
     def get_component_health(self) -> Dict[str, str]:
         """Get health status of all components"""
-        with self._lock:
-            return dict(self.component_states)
+        # Writers publish a new dict instead of mutating, so the current one is a stable snapshot
+        return self.component_states
     
     def set_component_state(self, component: str, state: str):
         """Set the health state of a component"""
+        if self.component_states.get(component) == state:
+            return
+        
         with self._lock:
-            self.component_states[component] = state
-            logger.debug(f"Component {component} state set to {state}")
+            component_states = dict(self.component_states)
+            component_states[component] = state
+            self.component_states = component_states
+        logger.debug(f"Component {component} state set to {state}")
     
     def get_detailed_error_report(self) -> Dict[str, Any]:
         """Get comprehensive error report for diagnostics"""
-        with self._lock:
-            recent_errors = [
-                error for error in self.error_history
-                if datetime.fromisoformat(error['timestamp']) > datetime.now() - timedelta(hours=24)
-            ]
-            
-            return {
-                'timestamp': datetime.now().isoformat(),
-                'error_statistics': self.get_error_statistics(),
-                'component_health': self.get_component_health(),
-                'recent_errors': recent_errors[-50:],  # Last 50 errors
-                'system_stats': self.system_monitor.get_system_stats(),
-                'resource_warnings': self.system_monitor.check_resource_limits(),
-                'configuration': {
-                    'max_retries': self.max_retries,
-                    'error_threshold': self.error_threshold,
-                    'time_window': self.time_window
-                }
+        cutoff = time.time() - 24 * 3600
+        
+        # Walk back from the newest record and stop at the first one outside the window.
+        # History is appended without the lock, so iterate a copy rather than the live deque
+        recent_errors = []
+        for summary in reversed(self.error_history.copy()):
+            if len(recent_errors) >= 50 or summary.timestamp <= cutoff:
+                break
+            recent_errors.append(summary.to_dict())
+        recent_errors.reverse()
+        
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'error_statistics': self.get_error_statistics(),
+            'component_health': self.get_component_health(),
+            'recent_errors': recent_errors,  # Last 50 errors
+            'system_stats': self.system_monitor.get_system_stats(),
+            'resource_warnings': self.system_monitor.check_resource_limits(),
+            'configuration': {
+                'max_retries': self.max_retries,
+                'error_threshold': self.error_threshold,
+                'time_window': self.time_window
             }
+        }
     
     def save_error_report(self, filename: Optional[str] = None) -> str:
         """Save detailed error report to file"""
@@ -684,7 +1120,7 @@ class ProductionErrorHandler:
         try:
             report = self.get_detailed_error_report()
             with open(report_path, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+                f.write(_json_dumps(report, indent=True))
             
             logger.info(f"Error report saved to {report_path}")
             return str(report_path)
@@ -696,17 +1132,19 @@ class ProductionErrorHandler:
     def cleanup_old_error_logs(self, days: int = 30):
         """Clean up old error logs"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            
-            for log_file in self.error_log_dir.glob("*.log"):
-                if log_file.stat().st_mtime < cutoff_date.timestamp():
-                    log_file.unlink()
-                    logger.debug(f"Removed old error log: {log_file}")
+            cutoff_timestamp = time.time() - days * 86400
             
-            for json_file in self.error_log_dir.glob("*.json"):
-                if json_file.stat().st_mtime < cutoff_date.timestamp():
-                    json_file.unlink()
-                    logger.debug(f"Removed old error report: {json_file}")
+            # One directory scan; DirEntry caches the file type from the listing
+            with os.scandir(self.error_log_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith((".log", ".json")) or not entry.is_file():
+                        continue
+                    if entry.stat().st_mtime < cutoff_timestamp:
+                        os.unlink(entry.path)
+                        if entry.name.endswith(".log"):
+                            logger.debug(f"Removed old error log: {entry.path}")
+                        else:
+                            logger.debug(f"Removed old error report: {entry.path}")
                     
         except Exception as e:
             logger.error(f"Failed to cleanup old error logs: {e}")
@@ -714,8 +1152,8 @@ class ProductionErrorHandler:
     def reset_error_counts(self):
         """Reset error tracking"""
         with self._lock:
-            self.error_counts.clear()
-            self.last_errors.clear()
+            self._stats = None
+            self._stats_generation = next(self._stats_generations)
         logger.info("Error counts reset")
     
     def is_shutdown_requested(self) -> bool:
@@ -724,34 +1162,38 @@ class ProductionErrorHandler:
 
 
 # Enhanced decorators for production error handling
+
+# Metadata copied onto decorator wrappers. Leaving out __annotations__ and the
+# __dict__ merge keeps decoration cheap for modules that decorate many functions;
+# __wrapped__ still points at the original for introspection
+_WRAPPER_ASSIGNMENTS = ('__module__', '__name__', '__qualname__', '__doc__')
+
+
 def production_safe_execute(context: str = "", fallback_value: Any = None, 
                           log_errors: bool = True, raise_on_failure: bool = False):
     """Enhanced decorator for production-safe execution with comprehensive error handling"""
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        component_context = context or func.__name__
+        if isinstance(component_context, str):
+            component_context = sys.intern(component_context)
+        
+        @functools.wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
         def wrapper(*args, **kwargs):
-            error_handler = get_error_handler()
+            # A plain global read once the singleton exists; the factory only runs before that
+            error_handler = _global_error_handler or get_error_handler()
             
             try:
                 result = func(*args, **kwargs)
                 
                 # Mark component as healthy if it was previously unhealthy
-                component_context = context or func.__name__
                 if error_handler.component_states.get(component_context) == "unhealthy":
                     error_handler.set_component_state(component_context, "healthy")
                 
                 return result
                 
             except Exception as e:
-                # Mark component as unhealthy
-                component_context = context or func.__name__
-                error_handler.set_component_state(component_context, "unhealthy")
-                
-                # Handle the error
-                recovery_success = error_handler.handle_error(e, component_context)
-                
-                # Add to error history
-                error_handler.add_error_to_history(e, component_context, recovery_success)
+                # Mark component as unhealthy and handle the error
+                recovery_success = error_handler.record_component_failure(e, component_context, "unhealthy")
                 
                 if log_errors:
                     logger.error(f"Error in {component_context}: {e}", exc_info=True)
@@ -767,92 +1209,317 @@ def production_safe_execute(context: str = "", fallback_value: Any = None,
     return decorator
 
 
+# Innermost component running under critical_operation; follows threads and asyncio tasks,
+# so errors handled without an explicit context are attributed to the right component
+current_component: ContextVar[str] = ContextVar("component", default="")
+
+# Set on shutdown so retry backoff waits return immediately
+_shutdown_event = threading.Event()
+
+
+def request_shutdown():
+    """Abort pending retry backoffs so decorated operations fail fast during shutdown"""
+    _shutdown_event.set()
+
+
+# Private generator so retry jitter does not contend on the shared random module state
+_rand = random.Random()
+
+
+def _jitter(delay: float) -> float:
+    """Spread a backoff delay over +/-50% so concurrent callers do not retry in lockstep"""
+    return _rand.uniform(0.5 * delay, 1.5 * delay)
+
+
+def _backoff_delays(delay: float, max_retries: int, max_delay: float) -> Tuple[float, ...]:
+    """Exponential backoff delay before each retry, capped at max_delay"""
+    return tuple(min(max_delay, delay * (1 << attempt)) for attempt in range(max_retries))
+
+
+def _retry_core(func: Callable, error: Exception, args: tuple, kwargs: dict,
+                delays: Tuple[float, ...], max_delay: float, exceptions: tuple, deadline: Optional[float],
+                on_retry: Callable[[int, Exception], None],
+                on_give_up: Callable[[int, Exception], None],
+                on_success: Optional[Callable[[], None]] = None):
+    """Retry an operation after its first attempt failed with ``error``
+    
+    Shared by the retry decorators, which differ only in the hooks they pass:
+    ``on_retry`` runs before each backoff, ``on_give_up`` receives the attempt count
+    once retries are exhausted and ``on_success`` runs after a retry succeeds. Jittered
+    backoffs stay within ``max_delay``, and when ``deadline`` (a perf_counter value) is
+    given, no backoff extends past it.
+    """
+    attempts = 1
+    for attempt, delay in enumerate(delays):
+        delay = min(max_delay, _jitter(delay))
+        if deadline is not None:
+            delay = min(delay, deadline - time.perf_counter())
+            if delay <= 0:
+                break
+        on_retry(attempt, error)
+        # Wait before retry with exponential backoff, giving up on shutdown
+        if _shutdown_event.wait(delay):
+            raise error
+        attempts += 1
+        try:
+            result = func(*args, **kwargs)
+        except exceptions as e:
+            error = e
+        else:
+            if on_success is not None:
+                on_success()
+            return result
+    
+    on_give_up(attempts, error)
+    raise error
+
+
+async def _async_retry_core(func: Callable, error: Exception, args: tuple, kwargs: dict,
+                            delays: Tuple[float, ...], max_delay: float, exceptions: tuple,
+                            deadline: Optional[float],
+                            on_retry: Callable[[int, Exception], None],
+                            on_give_up: Callable[[int, Exception], None],
+                            on_success: Optional[Callable[[], None]] = None):
+    """Coroutine counterpart of _retry_core that backs off without blocking the event loop"""
+    attempts = 1
+    for attempt, delay in enumerate(delays):
+        delay = min(max_delay, _jitter(delay))
+        if deadline is not None:
+            delay = min(delay, deadline - time.perf_counter())
+            if delay <= 0:
+                break
+        on_retry(attempt, error)
+        if _shutdown_event.is_set():
+            raise error
+        await asyncio.sleep(delay)
+        attempts += 1
+        try:
+            result = await func(*args, **kwargs)
+        except exceptions as e:
+            error = e
+        else:
+            if on_success is not None:
+                on_success()
+            return result
+    
+    on_give_up(attempts, error)
+    raise error
+
+
+def _critical_hooks(component_context: str, max_retries: int):
+    """Retry hooks that report a critical operation's failures to the error handler"""
+    # Records carry the component as structured data for handlers that want it
+    log = logging.LoggerAdapter(logger, {"component": component_context})
+    
+    def on_retry(attempt: int, error: Exception):
+        log.warning("Critical operation %s failed (attempt %d/%d): %s",
+                    component_context, attempt + 1, max_retries + 1, error)
+        
+        (_global_error_handler or get_error_handler()).handle_error(error, component_context)
+    
+    def on_give_up(attempts: int, error: Exception):
+        log.critical("Critical operation %s failed after %d attempts: %s",
+                     component_context, attempts, error)
+        (_global_error_handler or get_error_handler()).record_component_failure(
+            error, component_context, "critical")
+    
+    def on_success():
+        (_global_error_handler or get_error_handler()).set_component_state(component_context, "healthy")
+    
+    return on_retry, on_give_up, on_success
+
+
+def _retry_hooks(name: str, max_retries: int):
+    """Retry hooks that only log each failed attempt"""
+    log = logging.LoggerAdapter(logger, {"component": name})
+    
+    def on_retry(attempt: int, error: Exception):
+        log.warning("Attempt %d failed for %s: %s", attempt + 1, name, error)
+    
+    def on_give_up(attempts: int, error: Exception):
+        log.error("All %d attempts failed for %s", attempts, name)
+    
+    return on_retry, on_give_up
+
+
 def critical_operation(context: str = "", max_retries: int = 3, 
-                      retry_delay: float = 1.0):
-    """Decorator for critical operations that must succeed or fail gracefully"""
+                      retry_delay: float = 1.0, exceptions: tuple = (Exception,),
+                      max_delay: float = 30.0, total_timeout: Optional[float] = None):
+    """Decorator for critical operations that must succeed or fail gracefully
+    
+    Only ``exceptions`` are retried and recorded; anything else propagates untouched.
+    With ``total_timeout`` set, retrying stops once that many seconds have passed
+    since the call started.
+    """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        if asyncio.iscoroutinefunction(func):
+            return async_critical_operation(context, max_retries, retry_delay, exceptions,
+                                            max_delay, total_timeout)(func)
+        
+        component_context = context or func.__name__
+        delays = _backoff_delays(retry_delay, max_retries, max_delay)
+        on_retry, on_give_up, on_success = _critical_hooks(component_context, max_retries)
+        error_handler = None
+        
+        @functools.wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
         def wrapper(*args, **kwargs):
-            error_handler = get_error_handler()
-            last_exception = None
+            nonlocal error_handler
+            if error_handler is None:
+                error_handler = get_error_handler()
+            deadline = time.perf_counter() + total_timeout if total_timeout is not None else None
+            token = current_component.set(component_context)
             
-            for attempt in range(max_retries + 1):
+            try:
+                # First attempt inline; retries live in the slow path
                 try:
                     result = func(*args, **kwargs)
-                    
-                    # Mark as successful
-                    component_context = context or func.__name__
-                    error_handler.set_component_state(component_context, "healthy")
-                    
-                    return result
-                    
-                except Exception as e:
-                    last_exception = e
-                    component_context = context or func.__name__
-                    
-                    if attempt < max_retries:
-                        logger.warning(f"Critical operation {component_context} failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                        
-                        # Handle error and check if we should retry
-                        recovery_success = error_handler.handle_error(e, component_context)
-                        error_handler.add_error_to_history(e, component_context, recovery_success)
-                        
-                        # Wait before retry with exponential backoff
-                        time.sleep(retry_delay * (2 ** attempt))
-                    else:
-                        # Final attempt failed
-                        logger.critical(f"Critical operation {component_context} failed after all retries: {e}")
-                        error_handler.set_component_state(component_context, "critical")
-                        error_handler.handle_error(e, component_context)
-                        error_handler.add_error_to_history(e, component_context, False)
+                except exceptions as e:
+                    return _retry_core(func, e, args, kwargs, delays, max_delay, exceptions, deadline,
+                                       on_retry, on_give_up, on_success)
+            finally:
+                current_component.reset(token)
             
-            # All retries exhausted
-            raise last_exception
+            # Mark as successful
+            error_handler.set_component_state(component_context, "healthy")
+            return result
             
         return wrapper
     return decorator
 
 
 def retry_on_failure(max_retries: int = 3, delay: float = 1.0, 
-                    exceptions: tuple = (Exception,)):
-    """Decorator for retrying operations on failure"""
+                    exceptions: tuple = (Exception,), max_delay: float = 30.0,
+                    total_timeout: Optional[float] = None):
+    """Decorator for retrying operations on failure
+    
+    With ``total_timeout`` set, retrying stops once that many seconds have passed
+    since the call started.
+    """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        if asyncio.iscoroutinefunction(func):
+            return async_retry_on_failure(max_retries, delay, exceptions, max_delay,
+                                          total_timeout)(func)
+        
+        delays = _backoff_delays(delay, max_retries, max_delay)
+        on_retry, on_give_up = _retry_hooks(func.__name__, max_retries)
+        
+        @functools.wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
         def wrapper(*args, **kwargs):
-            last_exception = None
+            deadline = time.perf_counter() + total_timeout if total_timeout is not None else None
+            
+            # First attempt inline; retries live in the slow path
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                return _retry_core(func, e, args, kwargs, delays, max_delay, exceptions, deadline,
+                                   on_retry, on_give_up)
+        return wrapper
+    return decorator
+
+
+def retry_call(func: Callable, *args, max_retries: int = 3, delay: float = 1.0,
+               exceptions: tuple = (Exception,), max_delay: float = 30.0,
+               total_timeout: Optional[float] = None, **kwargs):
+    """Call func with retries on failure, without building a retry_on_failure decorator
+    
+    For one-off call sites, or where the callable is only known at runtime.
+    """
+    deadline = time.perf_counter() + total_timeout if total_timeout is not None else None
+    
+    try:
+        return func(*args, **kwargs)
+    except exceptions as e:
+        # The schedule and hooks are only needed once the first attempt has failed
+        on_retry, on_give_up = _retry_hooks(getattr(func, '__name__', repr(func)), max_retries)
+        return _retry_core(func, e, args, kwargs, _backoff_delays(delay, max_retries, max_delay),
+                           max_delay, exceptions, deadline, on_retry, on_give_up)
+
+
+def async_critical_operation(context: str = "", max_retries: int = 3,
+                             retry_delay: float = 1.0, exceptions: tuple = (Exception,),
+                             max_delay: float = 30.0, total_timeout: Optional[float] = None):
+    """Coroutine variant of critical_operation that backs off without blocking the event loop"""
+    def decorator(func: Callable) -> Callable:
+        component_context = context or func.__name__
+        delays = _backoff_delays(retry_delay, max_retries, max_delay)
+        on_retry, on_give_up, on_success = _critical_hooks(component_context, max_retries)
+        error_handler = None
+        
+        @functools.wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
+        async def wrapper(*args, **kwargs):
+            nonlocal error_handler
+            if error_handler is None:
+                error_handler = get_error_handler()
+            deadline = time.perf_counter() + total_timeout if total_timeout is not None else None
+            token = current_component.set(component_context)
             
-            for attempt in range(max_retries + 1):
+            try:
                 try:
-                    return func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}")
-                        time.sleep(delay * (2 ** attempt))  # Exponential backoff
-                    else:
-                        logger.error(f"All {max_retries + 1} attempts failed for {func.__name__}")
+                    return await _async_retry_core(func, e, args, kwargs, delays, max_delay, exceptions,
+                                                   deadline, on_retry, on_give_up, on_success)
+            finally:
+                current_component.reset(token)
+            
+            # Mark as successful
+            error_handler.set_component_state(component_context, "healthy")
+            return result
             
-            raise last_exception
+        return wrapper
+    return decorator
+
+
+def async_retry_on_failure(max_retries: int = 3, delay: float = 1.0,
+                           exceptions: tuple = (Exception,), max_delay: float = 30.0,
+                           total_timeout: Optional[float] = None):
+    """Coroutine variant of retry_on_failure that backs off without blocking the event loop"""
+    def decorator(func: Callable) -> Callable:
+        delays = _backoff_delays(delay, max_retries, max_delay)
+        on_retry, on_give_up = _retry_hooks(func.__name__, max_retries)
+        
+        @functools.wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
+        async def wrapper(*args, **kwargs):
+            deadline = time.perf_counter() + total_timeout if total_timeout is not None else None
+            
+            try:
+                return await func(*args, **kwargs)
+            except exceptions as e:
+                return await _async_retry_core(func, e, args, kwargs, delays, max_delay, exceptions,
+                                               deadline, on_retry, on_give_up)
         return wrapper
     return decorator
 
 
 # Global error handler instance
 _global_error_handler: Optional[ProductionErrorHandler] = None
+_global_error_handler_lock = threading.Lock()
+_error_handling_initialized = False
 
 
+@functools.lru_cache(maxsize=None)
 def get_error_handler() -> ProductionErrorHandler:
     """Get the global production error handler instance"""
+    # Only reached until the first result is cached; the lock keeps racing
+    # first callers from constructing two handlers
     global _global_error_handler
-    if _global_error_handler is None:
-        _global_error_handler = ProductionErrorHandler()
-    return _global_error_handler
+    with _global_error_handler_lock:
+        if _global_error_handler is None:
+            _global_error_handler = ProductionErrorHandler()
+        return _global_error_handler
 
 
 def initialize_error_handling():
-    """Initialize the production error handling system"""
+    """Initialize the production error handling system; repeated calls return the same handler"""
+    global _error_handling_initialized
     error_handler = get_error_handler()
-    logger.info("Production error handling system initialized")
+    
+    if not _error_handling_initialized:
+        with _global_error_handler_lock:
+            first_call = not _error_handling_initialized
+            _error_handling_initialized = True
+        if first_call:
+            logger.info("Production error handling system initialized")
     return error_handler
 
 
@@ -7,19 +7,30 @@ memory usage, and implements automatic remediation for common issues.
 """
 
 import logging
+import mmap
+import os
+import re
+import shutil
 import threading
 import time
 import psutil
 import subprocess
-from typing import Dict, Any, List, Optional, Callable
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Deque, Iterable, List, NamedTuple, Optional, Callable, Tuple, Union
+from collections import deque
+from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass, field
 import json
+import importlib.util
+import itertools
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Card entries in /proc/asound/cards, e.g. " 0 [PCH            ]: HDA-Intel - HDA Intel PCH"
+_ALSA_CARD_LINE = re.compile(r"\s*\d+ \[")
+
 
 class HealthStatus(Enum):
     """Health status levels"""
@@ -49,11 +60,22 @@ class HealthCheck:
     status: HealthStatus
     message: str
     details: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # epoch seconds
     remediation_attempted: bool = False
     remediation_successful: bool = False
 
 
+# Checks answered from /proc without forking; these keep their pace while idle
+_CHEAP_COMPONENTS = frozenset({ComponentType.MEMORY_USAGE, ComponentType.CPU_USAGE})
+
+
+class HealthCheckSummary(NamedTuple):
+    """Compact form a HealthCheck is reduced to once it ages out of detailed history"""
+    component: ComponentType
+    status: HealthStatus
+    timestamp: float
+
+
 @dataclass
 class HealthThresholds:
     """Configurable health thresholds"""
@@ -65,6 +87,13 @@ class HealthThresholds:
     disk_critical_percent: float = 95.0
     audio_timeout_seconds: float = 5.0
     recognition_timeout_seconds: float = 10.0
+    # Polling interval in seconds for components that change slowly; the rest are
+    # checked every monitoring interval
+    intervals: Dict[ComponentType, int] = field(default_factory=lambda: {
+        ComponentType.AUDIO_SYSTEM: 60,
+        ComponentType.SERVICE_STATUS: 120,
+        ComponentType.DISK_USAGE: 300,
+    })
 
 
 class HealthMonitor:
@@ -79,24 +108,73 @@ class HealthMonitor:
         self.monitoring_active = False
         self.monitoring_thread: Optional[threading.Thread] = None
         self.check_interval = 30  # seconds
+        self._stop_event = threading.Event()  # wakes the monitoring loop to exit
+        self._report_requested_since_last_check = False  # set by get_health_report
+        self.idle_interval_multiplier = 5  # expensive checks run this much less often when idle
         
         # Health data
         self.current_health: Dict[ComponentType, HealthCheck] = {}
-        self.health_history: List[HealthCheck] = []
+        self._overall_status = HealthStatus.UNKNOWN  # aggregated whenever current_health is published
         self.max_history_size = 1000
+        self.health_history: Deque[HealthCheck] = deque(maxlen=self.max_history_size)
+        
+        # Checks older than history_detail_window seconds are kept only as summaries
+        self.history_detail_window = 3600
+        self.history_summaries: Deque[HealthCheckSummary] = deque(maxlen=self.max_history_size)
         
         # Remediation handlers
         self.remediation_handlers: Dict[ComponentType, Callable] = {}
-        self.remediation_cooldown: Dict[ComponentType, float] = {}
+        self.remediation_cooldown: Dict[ComponentType, float] = {}  # monotonic time of last attempt
         self.cooldown_period = 300  # 5 minutes
         
         # Statistics
         self.check_count = 0
         self.remediation_count = 0
-        self.last_full_check = None
+        self.last_full_check: Optional[float] = None  # epoch seconds
+        
+        # Locks for thread safety, one per independent piece of state: publishing
+        # current_health with the check counters, remediation cooldowns with their
+        # counter, and moving aged checks from history to summaries
+        self._current_lock = threading.Lock()
+        self._remediation_lock = threading.Lock()
+        self._history_lock = threading.Lock()
+        
+        # Handle on this process, reused so psutil can batch reads with oneshot().
+        # The first cpu_percent() call only sets the baseline for the next one
+        self._proc = psutil.Process()
+        self._proc.cpu_percent(interval=None)
         
-        # Lock for thread safety
-        self._lock = threading.Lock()
+        # CPU usage over a window shorter than this is mostly clock-tick noise, so such
+        # checks reuse the previous reading instead of starting a new one
+        self.min_cpu_sample_window = 0.5  # seconds
+        self._cpu_sampled_at = time.monotonic()
+        self._last_cpu_percent: Optional[float] = None
+        
+        # Constants for reading RSS straight from /proc/self/statm
+        self._page_size = mmap.PAGESIZE
+        self._total_memory = psutil.virtual_memory().total
+        
+        # Results of probes that only change when software is installed or removed,
+        # keyed by probe name: (monotonic time taken, result)
+        self._static_cache: Dict[str, Tuple[float, Any]] = {}
+        self.static_probe_ttl = 3600  # 1 hour
+        
+        # Check function for each monitored component
+        self._probes: Dict[ComponentType, Callable[[], HealthCheck]] = {
+            ComponentType.MEMORY_USAGE: self._check_memory_usage,
+            ComponentType.CPU_USAGE: self._check_cpu_usage,
+            ComponentType.DISK_USAGE: self._check_disk_usage,
+            ComponentType.AUDIO_SYSTEM: self._check_audio_system,
+            ComponentType.SPEECH_RECOGNITION: self._check_speech_recognition,
+            ComponentType.GUI_SYSTEM: self._check_gui_system,
+            ComponentType.INPUT_SYSTEM: self._check_input_system,
+            ComponentType.SERVICE_STATUS: self._check_service_status,
+        }
+        
+        # Worker threads for the component checks, so their subprocess waits overlap;
+        # kept only while monitoring is active
+        self._probe_pool: Optional[ThreadPoolExecutor] = None
+        self._probe_pool_lock = threading.Lock()
         
         # Register default remediation handlers
         self._register_default_remediations()
@@ -124,6 +202,11 @@ class HealthMonitor:
         
         self.check_interval = interval
         self.monitoring_active = True
+        self._stop_event.clear()
+        
+        with self._probe_pool_lock:
+            if self._probe_pool is None:
+                self._probe_pool = _new_probe_pool()
         
         self.monitoring_thread = threading.Thread(
             target=self._monitoring_loop,
@@ -136,43 +219,90 @@ class HealthMonitor:
     def stop_monitoring(self):
         """Stop health monitoring"""
         self.monitoring_active = False
+        self._stop_event.set()
         
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=10)
         
+        # Don't leave idle probe threads behind; a hung probe must not stall interpreter exit either
+        with self._probe_pool_lock:
+            probe_pool, self._probe_pool = self._probe_pool, None
+        if probe_pool is not None:
+            probe_pool.shutdown(wait=False)
+        
         logger.info("Stopped health monitoring")
     
     def _monitoring_loop(self):
         """Main monitoring loop"""
-        while self.monitoring_active:
+        # Each component runs on its own schedule; wake for whichever is due next
+        last_run: Dict[ComponentType, Optional[float]] = {component: None for component in self._probes}
+        
+        while not self._stop_event.is_set():
             try:
-                self.perform_health_check()
-                time.sleep(self.check_interval)
+                # While everything is healthy and nobody is reading reports, only the
+                # cheap /proc checks keep their normal pace
+                idle = self._overall_status == HealthStatus.HEALTHY and not self._report_requested_since_last_check
+                next_due = {
+                    component: 0.0 if ran_at is None else ran_at + self._polling_interval(component, idle)
+                    for component, ran_at in last_run.items()
+                }
+                now = time.monotonic()
+                due = [component for component, due_at in next_due.items() if due_at <= now]
+                if due:
+                    if not _CHEAP_COMPONENTS.issuperset(due):
+                        self._report_requested_since_last_check = False
+                    self.perform_health_check(due)
+                    now = time.monotonic()
+                    for component in due:
+                        last_run[component] = now
+                        next_due[component] = now + self._polling_interval(component, idle)
+                
+                self._stop_event.wait(max(0.0, min(next_due.values()) - time.monotonic()))
             except Exception as e:
                 logger.error(f"Error in health monitoring loop: {e}")
-                time.sleep(self.check_interval)
+                self._stop_event.wait(self.check_interval)
+    
+    def _polling_interval(self, component: ComponentType, idle: bool) -> float:
+        """Seconds between checks of a component, stretched for expensive checks while idle"""
+        interval = self.thresholds.intervals.get(component, self.check_interval)
+        if idle and component not in _CHEAP_COMPONENTS:
+            interval *= self.idle_interval_multiplier
+        return interval
     
-    def perform_health_check(self) -> Dict[ComponentType, HealthCheck]:
-        """Perform comprehensive health check"""
+    def perform_health_check(self, components: Optional[Iterable[ComponentType]] = None
+                             ) -> Dict[ComponentType, HealthCheck]:
+        """Perform comprehensive health check, or only the checks for the given components"""
         logger.debug("Performing health check...")
         
-        checks = {}
-        
-        # Perform individual component checks
-        checks[ComponentType.MEMORY_USAGE] = self._check_memory_usage()
-        checks[ComponentType.CPU_USAGE] = self._check_cpu_usage()
-        checks[ComponentType.DISK_USAGE] = self._check_disk_usage()
-        checks[ComponentType.AUDIO_SYSTEM] = self._check_audio_system()
-        checks[ComponentType.SPEECH_RECOGNITION] = self._check_speech_recognition()
-        checks[ComponentType.GUI_SYSTEM] = self._check_gui_system()
-        checks[ComponentType.INPUT_SYSTEM] = self._check_input_system()
-        checks[ComponentType.SERVICE_STATUS] = self._check_service_status()
-        
-        # Update current health status
-        with self._lock:
-            self.current_health.update(checks)
+        probes = self._probes
+        if components is not None:
+            probes = {component: probes[component] for component in components}
+        
+        # Perform individual component checks concurrently; each one handles its own
+        # errors, so the slowest subprocess probe bounds the total wall time
+        with self._probe_pool_lock:
+            probe_pool = self._probe_pool
+        if probe_pool is not None:
+            checks = _run_probes(probe_pool, probes)
+        else:
+            # Checked outside monitoring: the threads only live for this check
+            with _new_probe_pool() as probe_pool:
+                checks = _run_probes(probe_pool, probes)
+        
+        # One timestamp for the whole collection, which also keeps history in time order
+        now = time.time()
+        for check in checks.values():
+            check.timestamp = now
+        
+        # Update current health status. Writers publish a new dict instead of mutating,
+        # so readers can use whichever one they see without taking the lock
+        with self._current_lock:
+            current_health = dict(self.current_health)
+            current_health.update(checks)
+            self.current_health = current_health
+            self._overall_status = _aggregate_status(current_health.values())
             self.check_count += 1
-            self.last_full_check = datetime.now()
+            self.last_full_check = now
         
         # Add to history
         for check in checks.values():
@@ -187,9 +317,9 @@ class HealthMonitor:
     def _check_memory_usage(self) -> HealthCheck:
         """Check memory usage"""
         try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
+            rss = self._read_rss()
+            memory_mb = rss / 1024 / 1024
+            memory_percent = rss / self._total_memory * 100
             
             if memory_mb >= self.thresholds.memory_critical_mb:
                 status = HealthStatus.CRITICAL
@@ -207,13 +337,12 @@ class HealthMonitor:
                 message=message,
                 details={
                     "memory_mb": memory_mb,
-                    "memory_percent": process.memory_percent(),
-                    "threshold_warning": self.thresholds.memory_warning_mb,
-                    "threshold_critical": self.thresholds.memory_critical_mb
+                    "memory_percent": memory_percent
                 }
             )
             
         except Exception as e:
+            self._reset_stale_process(e)
             logger.error(f"Memory check failed: {e}")
             return HealthCheck(
                 component=ComponentType.MEMORY_USAGE,
@@ -224,8 +353,23 @@ class HealthMonitor:
     def _check_cpu_usage(self) -> HealthCheck:
         """Check CPU usage"""
         try:
-            process = psutil.Process()
-            cpu_percent = process.cpu_percent(interval=1)
+            # Non-blocking: CPU usage averaged since the previous sample
+            now = time.monotonic()
+            if now - self._cpu_sampled_at >= self.min_cpu_sample_window:
+                with self._proc.oneshot():
+                    self._last_cpu_percent = self._proc.cpu_percent(interval=None)
+                    num_threads = self._proc.num_threads()
+                self._cpu_sampled_at = now
+            elif self._last_cpu_percent is None:
+                # Checked right after start-up; the window is too short to mean anything yet
+                return HealthCheck(
+                    component=ComponentType.CPU_USAGE,
+                    status=HealthStatus.UNKNOWN,
+                    message="CPU usage not sampled yet"
+                )
+            else:
+                num_threads = self._proc.num_threads()
+            cpu_percent = self._last_cpu_percent
             
             if cpu_percent >= self.thresholds.cpu_critical_percent:
                 status = HealthStatus.CRITICAL
@@ -243,13 +387,12 @@ class HealthMonitor:
                 message=message,
                 details={
                     "cpu_percent": cpu_percent,
-                    "num_threads": process.num_threads(),
-                    "threshold_warning": self.thresholds.cpu_warning_percent,
-                    "threshold_critical": self.thresholds.cpu_critical_percent
+                    "num_threads": num_threads
                 }
             )
             
         except Exception as e:
+            self._reset_stale_process(e)
             logger.error(f"CPU check failed: {e}")
             return HealthCheck(
                 component=ComponentType.CPU_USAGE,
@@ -257,12 +400,31 @@ class HealthMonitor:
                 message=f"CPU check failed: {e}"
             )
     
+    def _read_rss(self) -> int:
+        """Resident set size of this process in bytes"""
+        try:
+            # The second field of statm is resident pages; one small read, no parsing of /proc/self/status
+            with open("/proc/self/statm", "rb") as f:
+                return int(f.read().split()[1]) * self._page_size
+        except OSError:
+            return self._proc.memory_info().rss
+    
+    def _reset_stale_process(self, error: Exception):
+        """Replace the cached process handle if it no longer refers to this process (e.g. after a fork)"""
+        if isinstance(error, psutil.NoSuchProcess):
+            self._proc = psutil.Process()
+            self._proc.cpu_percent(interval=None)
+            self._cpu_sampled_at = time.monotonic()
+    
     def _check_disk_usage(self) -> HealthCheck:
         """Check disk usage"""
         try:
             # Check home directory disk usage
-            home_path = Path.home()
-            disk_usage = psutil.disk_usage(str(home_path))
+            home_path = str(Path.home())
+            if self.resource_manager:
+                disk_usage = self.resource_manager.get_cached_disk_usage(home_path, max_age=30)
+            else:
+                disk_usage = self._cached(f"disk_usage:{home_path}", 30, lambda: psutil.disk_usage(home_path))
             used_percent = (disk_usage.used / disk_usage.total) * 100
             
             if used_percent >= self.thresholds.disk_critical_percent:
@@ -282,9 +444,7 @@ class HealthMonitor:
                 details={
                     "used_percent": used_percent,
                     "free_gb": disk_usage.free / (1024**3),
-                    "total_gb": disk_usage.total / (1024**3),
-                    "threshold_warning": self.thresholds.disk_warning_percent,
-                    "threshold_critical": self.thresholds.disk_critical_percent
+                    "total_gb": disk_usage.total / (1024**3)
                 }
             )
             
@@ -330,6 +490,23 @@ class HealthMonitor:
     
     def _check_pulseaudio(self) -> Optional[HealthCheck]:
         """Check PulseAudio status"""
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_dir:
+            # A live server owns its socket; PipeWire also serves the pulse socket, so
+            # leave that case to _check_pipewire
+            if (not os.path.exists(os.path.join(runtime_dir, "pulse", "native"))
+                    or os.path.exists(os.path.join(runtime_dir, "pipewire-0"))):
+                return None
+            
+            device_count = self._count_capture_devices()
+            return HealthCheck(
+                component=ComponentType.AUDIO_SYSTEM,
+                status=HealthStatus.HEALTHY,
+                message=f"PulseAudio running with {device_count} input devices",
+                details={"audio_system": "pulseaudio", "device_count": device_count}
+            )
+        
+        # Without a runtime directory the socket cannot be located; ask the daemon instead
         try:
             result = subprocess.run(
                 ["pulseaudio", "--check"],
@@ -361,6 +538,19 @@ class HealthMonitor:
     
     def _check_pipewire(self) -> Optional[HealthCheck]:
         """Check PipeWire status"""
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_dir:
+            if not os.path.exists(os.path.join(runtime_dir, "pipewire-0")):
+                return None
+            
+            return HealthCheck(
+                component=ComponentType.AUDIO_SYSTEM,
+                status=HealthStatus.HEALTHY,
+                message="PipeWire detected",
+                details={"audio_system": "pipewire"}
+            )
+        
+        # Without a runtime directory the socket cannot be located; fall back to the binary
         try:
             result = subprocess.run(
                 ["pipewire", "--version"],
@@ -383,48 +573,35 @@ class HealthMonitor:
     def _check_alsa(self) -> Optional[HealthCheck]:
         """Check ALSA status"""
         try:
-            result = subprocess.run(
-                ["aplay", "-l"],
-                capture_output=True,
-                text=True,
-                timeout=self.thresholds.audio_timeout_seconds
-            )
+            # Each card is listed as "<index> [<id>]: ..." followed by a description line
+            with open("/proc/asound/cards") as f:
+                card_count = sum(1 for line in f if _ALSA_CARD_LINE.match(line))
             
-            if result.returncode == 0 and "card" in result.stdout:
-                card_count = result.stdout.count("card")
+            if card_count:
                 return HealthCheck(
                     component=ComponentType.AUDIO_SYSTEM,
                     status=HealthStatus.HEALTHY,
                     message=f"ALSA detected with {card_count} cards",
                     details={"audio_system": "alsa", "card_count": card_count}
                 )
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
+        except OSError:
             pass
         
         return None
     
+    def _count_capture_devices(self) -> int:
+        """Count capture-capable PCM devices known to the kernel"""
+        try:
+            with open("/proc/asound/pcm") as f:
+                return sum(1 for line in f if "capture" in line)
+        except OSError:
+            return 0
+    
     def _check_speech_recognition(self) -> HealthCheck:
         """Check speech recognition system"""
         try:
-            # This is a placeholder - would need to integrate with actual speech recognition
-            # For now, just check if the recognition module can be imported
-            
-            details = {"engines_available": []}
-            
-            # Check for Whisper
-            try:
-                import whisper
-                details["engines_available"].append("whisper")
-            except ImportError:
-                pass
-            
-            # Check for speech recognition engines (placeholder)
-            try:
-                # This would check for speech recognition availability
-                # TODO: Add actual speech recognition engine checks
-                pass
-            except:
-                pass
+            details = {"engines_available": list(self._cached(
+                "speech_engines", self.static_probe_ttl, self._detect_speech_engines))}
             
             if details["engines_available"]:
                 return HealthCheck(
@@ -452,8 +629,6 @@ class HealthMonitor:
     def _check_gui_system(self) -> HealthCheck:
         """Check GUI system health"""
         try:
-            import os
-            
             details = {}
             
             # Check display server
@@ -471,18 +646,8 @@ class HealthMonitor:
                 )
             
             # Check for GUI framework availability
-            gui_frameworks = []
-            try:
-                import PyQt5
-                gui_frameworks.append("PyQt5")
-            except ImportError:
-                pass
-            
-            try:
-                import tkinter
-                gui_frameworks.append("tkinter")
-            except ImportError:
-                pass
+            gui_frameworks = list(self._cached(
+                "gui_frameworks", self.static_probe_ttl, self._detect_gui_frameworks))
             
             details["gui_frameworks"] = gui_frameworks
             
@@ -512,22 +677,11 @@ class HealthMonitor:
     def _check_input_system(self) -> HealthCheck:
         """Check input system health"""
         try:
-            input_tools = []
-            
-            # Check for input simulation tools
-            tools_to_check = ["xdotool", "ydotool", "wtype", "dotool"]
-            
-            for tool in tools_to_check:
-                try:
-                    result = subprocess.run(
-                        [tool, "--help"],
-                        capture_output=True,
-                        timeout=2
-                    )
-                    if result.returncode == 0:
-                        input_tools.append(tool)
-                except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
-                    pass
+            # Check for input simulation tools; the lookup depends on PATH, so a
+            # changed PATH gets a fresh lookup instead of waiting out the TTL
+            input_tools = list(self._cached(
+                f"input_tools:{os.environ.get('PATH', '')}", self.static_probe_ttl,
+                self._detect_input_tools))
             
             if input_tools:
                 return HealthCheck(
@@ -552,6 +706,48 @@ class HealthMonitor:
                 message=f"Input check failed: {e}"
             )
     
+    def _cached(self, key: str, ttl: float, probe: Callable[[], Any]) -> Any:
+        """Return probe()'s result, re-running it at most once per ttl seconds"""
+        now = time.monotonic()
+        cached = self._static_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        value = probe()
+        self._static_cache[key] = (now, value)
+        return value
+    
+    def _detect_speech_engines(self) -> Tuple[str, ...]:
+        """Find installed speech recognition engines"""
+        # find_spec only locates the package; importing whisper would load torch into this process
+        engines = []
+        
+        # Check for Whisper
+        if importlib.util.find_spec("whisper") is not None:
+            engines.append("whisper")
+        
+        return tuple(engines)
+    
+    def _detect_gui_frameworks(self) -> Tuple[str, ...]:
+        """Find installed GUI frameworks"""
+        gui_frameworks = []
+        if importlib.util.find_spec("PyQt5") is not None:
+            gui_frameworks.append("PyQt5")
+        
+        # The tkinter package ships with Python; the Tk bindings it needs may not
+        if importlib.util.find_spec("_tkinter") is not None:
+            gui_frameworks.append("tkinter")
+        
+        return tuple(gui_frameworks)
+    
+    def _detect_input_tools(self) -> Tuple[str, ...]:
+        """Find installed input simulation tools"""
+        tools_to_check = ["xdotool", "ydotool", "wtype", "dotool"]
+        
+        # Look the tools up on PATH rather than launching them; xdotool --help alone
+        # opens a display connection
+        return tuple(tool for tool in tools_to_check if shutil.which(tool))
+    
     def _check_service_status(self) -> HealthCheck:
         """Check voice control service status"""
         try:
@@ -592,7 +788,14 @@ class HealthMonitor:
         """Attempt remediation for unhealthy components"""
         for component, check in checks.items():
             if check.status in [HealthStatus.WARNING, HealthStatus.CRITICAL]:
-                if self._should_attempt_remediation(component):
+                # Claim the cooldown slot atomically so overlapping health checks
+                # cannot remediate the same component twice
+                with self._remediation_lock:
+                    should_remediate = self._should_attempt_remediation(component)
+                    if should_remediate:
+                        self.remediation_cooldown[component] = time.monotonic()
+                
+                if should_remediate:
                     logger.info(f"Attempting remediation for {component.value}")
                     success = self._attempt_remediation(component, check)
                     
@@ -601,7 +804,8 @@ class HealthMonitor:
                     
                     if success:
                         logger.info(f"Remediation successful for {component.value}")
-                        self.remediation_count += 1
+                        with self._remediation_lock:
+                            self.remediation_count += 1
                     else:
                         logger.warning(f"Remediation failed for {component.value}")
     
@@ -610,13 +814,13 @@ class HealthMonitor:
         if component not in self.remediation_handlers:
             return False
         
-        last_attempt = self.remediation_cooldown.get(component, 0)
-        return time.time() - last_attempt > self.cooldown_period
+        last_attempt = self.remediation_cooldown.get(component)
+        return last_attempt is None or time.monotonic() - last_attempt > self.cooldown_period
     
     def _attempt_remediation(self, component: ComponentType, check: HealthCheck) -> bool:
         """Attempt remediation for a specific component"""
         try:
-            self.remediation_cooldown[component] = time.time()
+            self.remediation_cooldown[component] = time.monotonic()
             
             if component in self.remediation_handlers:
                 return self.remediation_handlers[component](check)
@@ -683,71 +887,71 @@ class HealthMonitor:
     
     def _add_to_history(self, check: HealthCheck):
         """Add health check to history"""
-        with self._lock:
-            self.health_history.append(check)
+        cutoff = check.timestamp - self.history_detail_window
+        history = self.health_history
+        
+        with self._history_lock:
+            # The bounded deque drops the oldest entry itself
+            history.append(check)
             
-            # Trim history if too large
-            if len(self.health_history) > self.max_history_size:
-                self.health_history.pop(0)
+            # Reduce checks past the detail window to summaries, dropping their details
+            while history[0].timestamp < cutoff:
+                old = history.popleft()
+                self.history_summaries.append(HealthCheckSummary(old.component, old.status, old.timestamp))
     
     def _get_overall_status(self) -> HealthStatus:
         """Get overall system health status"""
-        with self._lock:
-            if not self.current_health:
-                return HealthStatus.UNKNOWN
-            
-            statuses = [check.status for check in self.current_health.values()]
-            
-            if HealthStatus.CRITICAL in statuses:
-                return HealthStatus.CRITICAL
-            elif HealthStatus.WARNING in statuses:
-                return HealthStatus.WARNING
-            elif HealthStatus.UNKNOWN in statuses:
-                return HealthStatus.UNKNOWN
-            else:
-                return HealthStatus.HEALTHY
+        return self._overall_status
     
     def get_health_report(self) -> Dict[str, Any]:
         """Get comprehensive health report"""
-        with self._lock:
-            overall_status = self._get_overall_status()
-            
-            component_status = {}
-            for component, check in self.current_health.items():
-                component_status[component.value] = {
-                    "status": check.status.value,
-                    "message": check.message,
-                    "details": check.details,
-                    "timestamp": check.timestamp.isoformat(),
-                    "remediation_attempted": check.remediation_attempted,
-                    "remediation_successful": check.remediation_successful
-                }
-            
-            return {
-                "overall_status": overall_status.value,
-                "last_check": self.last_full_check.isoformat() if self.last_full_check else None,
-                "check_count": self.check_count,
-                "remediation_count": self.remediation_count,
-                "components": component_status,
-                "thresholds": {
-                    "memory_warning_mb": self.thresholds.memory_warning_mb,
-                    "memory_critical_mb": self.thresholds.memory_critical_mb,
-                    "cpu_warning_percent": self.thresholds.cpu_warning_percent,
-                    "cpu_critical_percent": self.thresholds.cpu_critical_percent
-                }
+        self._report_requested_since_last_check = True
+        current_health = self.current_health
+        overall_status = self._get_overall_status()
+        
+        component_status = {}
+        for component, check in current_health.items():
+            component_status[component.value] = {
+                "status": check.status.value,
+                "message": check.message,
+                "details": check.details,
+                "timestamp": datetime.fromtimestamp(check.timestamp).isoformat(),
+                "remediation_attempted": check.remediation_attempted,
+                "remediation_successful": check.remediation_successful
             }
+        
+        return {
+            "overall_status": overall_status.value,
+            "last_check": datetime.fromtimestamp(self.last_full_check).isoformat() if self.last_full_check else None,
+            "check_count": self.check_count,
+            "remediation_count": self.remediation_count,
+            "components": component_status,
+            "thresholds": {
+                "memory_warning_mb": self.thresholds.memory_warning_mb,
+                "memory_critical_mb": self.thresholds.memory_critical_mb,
+                "cpu_warning_percent": self.thresholds.cpu_warning_percent,
+                "cpu_critical_percent": self.thresholds.cpu_critical_percent,
+                "disk_warning_percent": self.thresholds.disk_warning_percent,
+                "disk_critical_percent": self.thresholds.disk_critical_percent
+            }
+        }
     
     def get_health_history(self, component: Optional[ComponentType] = None, 
                           hours: int = 24) -> List[Dict[str, Any]]:
         """Get health history for analysis"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff_time = time.time() - hours * 3600
         
-        with self._lock:
-            filtered_history = [
-                check for check in self.health_history
-                if check.timestamp >= cutoff_time and
-                (component is None or check.component == component)
-            ]
+        # Copy first: the monitoring thread may append while this filters. Summaries
+        # are older than every detailed check, so together they stay in time order
+        with self._history_lock:
+            history = list(self.history_summaries)
+            history.extend(self.health_history)
+        
+        # History is in append order, so skip everything before the cutoff with a binary search
+        filtered_history = [
+            check for check in itertools.islice(history, _first_at_or_after(history, cutoff_time), None)
+            if component is None or check.component == component
+        ]
         
         return [
             {
@@ -755,26 +959,83 @@ class HealthMonitor:
                 "status": check.status.value,
                 "message": check.message,
                 "details": check.details,
-                "timestamp": check.timestamp.isoformat(),
+                "timestamp": datetime.fromtimestamp(check.timestamp).isoformat(),
                 "remediation_attempted": check.remediation_attempted,
                 "remediation_successful": check.remediation_successful
             }
+            if isinstance(check, HealthCheck) else
+            {
+                "component": check.component.value,
+                "status": check.status.value,
+                "message": None,
+                "details": None,
+                "timestamp": datetime.fromtimestamp(check.timestamp).isoformat(),
+                "remediation_attempted": None,
+                "remediation_successful": None
+            }
             for check in filtered_history
         ]
 
 
+def _new_probe_pool() -> ThreadPoolExecutor:
+    """Thread pool for running component checks side by side"""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="health-probe")
+
+
+def _run_probes(probe_pool: ThreadPoolExecutor, probes: Dict[ComponentType, Callable[[], HealthCheck]]
+                ) -> Dict[ComponentType, HealthCheck]:
+    """Run probes on probe_pool and collect their checks"""
+    futures = {component: probe_pool.submit(probe) for component, probe in probes.items()}
+    return {component: future.result() for component, future in futures.items()}
+
+
+def _aggregate_status(checks: Iterable[HealthCheck]) -> HealthStatus:
+    """Worst status among checks: critical, then warning, then unknown"""
+    statuses = {check.status for check in checks}
+    if not statuses:
+        return HealthStatus.UNKNOWN
+    
+    if HealthStatus.CRITICAL in statuses:
+        return HealthStatus.CRITICAL
+    elif HealthStatus.WARNING in statuses:
+        return HealthStatus.WARNING
+    elif HealthStatus.UNKNOWN in statuses:
+        return HealthStatus.UNKNOWN
+    else:
+        return HealthStatus.HEALTHY
+
+
+def _first_at_or_after(history: List[Union[HealthCheck, HealthCheckSummary]], cutoff: float) -> int:
+    """Index of the first check in time-ordered history taken at or after cutoff"""
+    lo, hi = 0, len(history)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if history[mid].timestamp < cutoff:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
 # Global health monitor instance
 _global_health_monitor: Optional[HealthMonitor] = None
+_global_health_monitor_lock = threading.Lock()
 
 
 def get_health_monitor(resource_manager=None, error_handler=None) -> HealthMonitor:
     """Get or create global health monitor instance"""
     global _global_health_monitor
     
-    if _global_health_monitor is None:
-        _global_health_monitor = HealthMonitor(resource_manager, error_handler)
+    # The arguments only matter on the first call, so this can't be an lru_cache;
+    # check without the lock once created, and under it while racing to create
+    monitor = _global_health_monitor
+    if monitor is None:
+        with _global_health_monitor_lock:
+            if _global_health_monitor is None:
+                _global_health_monitor = HealthMonitor(resource_manager, error_handler)
+            monitor = _global_health_monitor
     
-    return _global_health_monitor
+    return monitor
 
 
 def main():
@@ -6,99 +6,287 @@ Manages system resources, prevents memory leaks, and handles cleanup
 to prevent the system hangs and restart issues.
 """
 
+import functools
 import gc
 import logging
+import mmap
+import os
 import psutil
 import threading
 import time
 import weakref
-from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 from contextlib import contextmanager
 import signal
 import sys
 
 logger = logging.getLogger(__name__)
 
+# Resources are registered under a name, or under (prefix, id(resource)) by register_by_id
+ResourceKey = Union[str, Tuple[str, int]]
+
+# Whether the process-wide collector tuning has been applied
+_gc_tuned = False
+
+# Collections the interpreter has finished per generation, and when (monotonic)
+# each generation last finished; garbage collection is process-wide, so these are too
+_gc_collections = [0, 0, 0]
+_gc_last_collection = [0.0, 0.0, 0.0]
+
+
+def _count_collection(phase: str, info: Dict[str, int]):
+    """gc.callbacks observer recording each finished collection"""
+    if phase == "stop":
+        generation = info["generation"]
+        _gc_collections[generation] += 1
+        _gc_last_collection[generation] = time.monotonic()
+
+
+gc.callbacks.append(_count_collection)
+
+
+def _tune_gc():
+    """Freeze startup objects out of the collector's scans and raise its thresholds (once per process)"""
+    global _gc_tuned
+    if _gc_tuned or os.environ.get("VC_GC_FREEZE", "1") != "1":
+        return
+    _gc_tuned = True
+    
+    # Models, handlers and singletons created so far live for the whole run;
+    # moving them to the permanent generation keeps full collections from rescanning them
+    gc.collect()
+    gc.freeze()
+    
+    g0, g1, g2 = gc.get_threshold()
+    gc.set_threshold(max(g0, 50_000), g1 * 3, g2 * 3)
+    logger.debug(f"Froze {gc.get_freeze_count()} objects, GC thresholds now {gc.get_threshold()}")
+
+
+class _ResourceEntry:
+    """A registered resource with its cleanup call (already bound to the resource) and monotonic timestamps
+    
+    Entries are recycled through ResourceManager's pool, so they are filled in by
+    bind() rather than the constructor.
+    """
+    __slots__ = ('resource', 'cleanup', 'created_at', 'last_accessed')
+    
+    def bind(self, resource: Any, cleanup: Callable[[Any], None]) -> "_ResourceEntry":
+        """Point this entry at a newly registered resource"""
+        self.resource = resource
+        self.cleanup = functools.partial(cleanup, resource)
+        self.created_at = self.last_accessed = time.monotonic()
+        return self
+    
+    def release(self):
+        """Drop the references to the resource before the entry goes back to the pool"""
+        self.resource = self.cleanup = None
+
+
+# Every live manager; a shutdown signal cleans all of them up
+_managers: "weakref.WeakSet[ResourceManager]" = weakref.WeakSet()
+_signals_installed = False
+
+# Managers with monitoring active, all served by one shared thread
+_monitors: "weakref.WeakSet[ResourceManager]" = weakref.WeakSet()
+_monitor_thread: Optional[threading.Thread] = None
+_monitor_lock = threading.Lock()
+_monitor_wake = threading.Event()  # set when the monitored set changes
+
+
+def _handle_shutdown_signal(signum, frame):
+    """Clean up every resource manager and exit"""
+    logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+    for manager in list(_managers):
+        manager.cleanup_all()
+    sys.exit(0)
+
+
+def _install_signal_handlers_once():
+    """Install the SIGTERM/SIGINT handler for graceful shutdown (once per process)"""
+    global _signals_installed
+    if _signals_installed:
+        return
+    signal.signal(signal.SIGTERM, _handle_shutdown_signal)
+    signal.signal(signal.SIGINT, _handle_shutdown_signal)
+    _signals_installed = True
+
+
+def _run_due_passes(managers: List["ResourceManager"]) -> float:
+    """Run the passes that are due; returns seconds until the next one"""
+    now = time.monotonic()
+    for manager in managers:
+        if manager.monitoring_active and manager._next_pass <= now:
+            manager._schedule_next_pass(manager._monitoring_pass())
+    return max(0.0, min(manager._next_pass for manager in managers) - time.monotonic())
+
+
+def _shared_monitoring_loop():
+    """Run each monitored manager's checks on its own cadence; exits once none are monitored"""
+    global _monitor_thread
+    while True:
+        # Cleared before the snapshot, so a manager started after it still wakes the wait below
+        _monitor_wake.clear()
+        with _monitor_lock:
+            managers = list(_monitors)
+            if not managers:
+                _monitor_thread = None
+                return
+        
+        # The helper's locals go with it; only this list needs dropping so a
+        # stopped manager isn't kept alive while waiting
+        timeout = _run_due_passes(managers)
+        del managers
+        _monitor_wake.wait(timeout)
+
 
 class ResourceManager:
     """Manages system resources and prevents memory leaks"""
     
     def __init__(self, max_memory_mb: int = 500):
         self.max_memory_mb = max_memory_mb
-        self.active_resources: Dict[str, Dict[str, Any]] = {}
+        # Least recently accessed first, so age scans stop at the first fresh entry
+        self.active_resources: "OrderedDict[ResourceKey, _ResourceEntry]" = OrderedDict()
         self.cleanup_handlers: List[Callable] = []
         self.monitoring_thread: Optional[threading.Thread] = None
         self.monitoring_active = False
+        self._monitor_interval = 30
+        self._next_pass = 0.0  # monotonic time of the next monitoring pass
+        self._failed_passes = 0  # consecutive passes that raised
+        self.max_monitor_backoff = 300.0
         self.process = psutil.Process()
+        self.process.cpu_percent(None)  # prime the counter so the first sample is meaningful
+        self._page_size = mmap.PAGESIZE
         self._lock = threading.Lock()
         
-        # Register signal handlers for graceful shutdown
-        self._setup_signal_handlers()
+        # Registrations are appended here without taking the lock and moved into
+        # active_resources by whichever thread next holds it
+        self._pending_adds: Deque[Tuple[ResourceKey, _ResourceEntry]] = deque()
         
-    def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-            self.cleanup_all()
-            sys.exit(0)
-            
-        signal.signal(signal.SIGTERM, signal_handler)
-        signal.signal(signal.SIGINT, signal_handler)
+        # Released entries kept for reuse so steady-state registration doesn't allocate them
+        self._entry_pool: Deque[_ResourceEntry] = deque(maxlen=256)
+        
+        # Process sample shared by the monitoring checks and get_resource_stats
+        self._stats_cache: Optional[Dict[str, float]] = None
+        self._stats_cache_ts = 0.0  # monotonic
+        
+        # Disk usage samples shared with the health monitor: path -> (monotonic time, usage)
+        self._disk_usage_cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # Only force a collection under memory pressure if the interpreter hasn't run one this recently
+        self.gc_idle_seconds = 60
+        
+        # Keep long-lived startup objects out of garbage collection passes
+        _tune_gc()
+        
+        # Cleaned up by the shutdown signal handler, once the application installs it
+        _managers.add(self)
     
-    def register_resource(self, name: str, resource: Any, cleanup_func: Callable[[Any], None]):
+    @staticmethod
+    def install_signal_handlers_from_main_thread() -> bool:
+        """Install the graceful shutdown handler for SIGTERM/SIGINT
+        
+        Python only allows signal handlers to be set from the main thread, so
+        this is left to application bootstrap rather than the constructor.
+        Returns False (and installs nothing) when called from another thread.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            logger.warning("Signal handlers can only be installed from the main thread")
+            return False
+        _install_signal_handlers_once()
+        return True
+    
+    def register_resource(self, name: ResourceKey, resource: Any, cleanup_func: Callable[[Any], None]):
         """Register a resource for automatic cleanup"""
+        # deque.pop and deque.append are atomic, so producers never contend with the monitor
+        try:
+            entry = self._entry_pool.pop()
+        except IndexError:
+            entry = _ResourceEntry()
+        self._pending_adds.append((name, entry.bind(resource, cleanup_func)))
+        logger.debug("Registered resource: %s", name)
+    
+    def register_by_id(self, prefix: str, resource: Any, cleanup_func: Callable[[Any], None]) -> ResourceKey:
+        """Register a resource under (prefix, id(resource)) without formatting a name
+        
+        Meant for resources registered at streaming rates, such as audio buffers.
+        The key is unique while the resource is alive and is shown as
+        "<prefix>_<id>" in get_resource_stats.
+        """
+        key = (prefix, id(resource))
+        self.register_resource(key, resource, cleanup_func)
+        return key
+    
+    def _drain_pending(self):
+        """Move pending registrations into active_resources, in order (caller holds self._lock)"""
+        pending = self._pending_adds
+        while pending:
+            name, entry = pending.popleft()
+            self.active_resources[name] = entry
+            self.active_resources.move_to_end(name)
+    
+    def _recycle(self, entry: _ResourceEntry):
+        """Return a removed entry to the pool"""
+        entry.release()
+        self._entry_pool.append(entry)
+    
+    def touch_resource(self, name: ResourceKey) -> bool:
+        """Mark a resource as accessed so it is not cleaned up as inactive"""
         with self._lock:
-            self.active_resources[name] = {
-                'resource': resource,
-                'cleanup': cleanup_func,
-                'created_at': time.time(),
-                'last_accessed': time.time()
-            }
-            logger.debug(f"Registered resource: {name}")
+            self._drain_pending()
+            entry = self.active_resources.get(name)
+            if entry is None:
+                return False
+            entry.last_accessed = time.monotonic()
+            self.active_resources.move_to_end(name)
+            return True
     
-    def unregister_resource(self, name: str) -> bool:
+    def unregister_resource(self, name: ResourceKey) -> bool:
         """Unregister a resource"""
         with self._lock:
+            self._drain_pending()
             if name in self.active_resources:
-                del self.active_resources[name]
-                logger.debug(f"Unregistered resource: {name}")
+                self._recycle(self.active_resources.pop(name))
+                logger.debug("Unregistered resource: %s", name)
                 return True
             return False
     
-    def cleanup_resource(self, name: str) -> bool:
+    def cleanup_resource(self, name: ResourceKey) -> bool:
         """Clean up a specific resource"""
         with self._lock:
+            self._drain_pending()
             if name not in self.active_resources:
                 return False
-                
-            resource_info = self.active_resources[name]
+            
+            # Removed even if its cleanup fails, to prevent accumulation
+            entry = self.active_resources.pop(name)
             try:
-                resource_info['cleanup'](resource_info['resource'])
-                del self.active_resources[name]
-                logger.debug(f"Cleaned up resource: {name}")
+                entry.cleanup()
+                logger.debug("Cleaned up resource: %s", name)
                 return True
             except Exception as e:
                 logger.error(f"Failed to cleanup resource {name}: {e}")
-                # Remove it anyway to prevent accumulation
-                del self.active_resources[name]
                 return False
+            finally:
+                self._recycle(entry)
     
     def cleanup_all(self):
         """Clean up all registered resources"""
         logger.info("Cleaning up all resources...")
         
+        # Take ownership of every registered resource; anything registered
+        # while cleanup runs lands in the fresh dict
         with self._lock:
-            resources_to_cleanup = list(self.active_resources.items())
+            self._drain_pending()
+            resources_to_cleanup, self.active_resources = self.active_resources, OrderedDict()
         
-        for name, resource_info in resources_to_cleanup:
+        for name, entry in resources_to_cleanup.items():
             try:
-                resource_info['cleanup'](resource_info['resource'])
-                logger.debug(f"Cleaned up resource: {name}")
+                entry.cleanup()
+                logger.debug("Cleaned up resource: %s", name)
             except Exception as e:
                 logger.error(f"Failed to cleanup resource {name}: {e}")
-        
-        with self._lock:
-            self.active_resources.clear()
+            self._recycle(entry)
         
         # Run additional cleanup handlers
         for handler in self.cleanup_handlers:
@@ -107,8 +295,6 @@ class ResourceManager:
             except Exception as e:
                 logger.error(f"Cleanup handler failed: {e}")
         
-        # Force garbage collection
-        gc.collect()
         logger.info("Resource cleanup completed")
     
     def add_cleanup_handler(self, handler: Callable[[], None]):
@@ -116,90 +302,159 @@ class ResourceManager:
         self.cleanup_handlers.append(handler)
     
     def start_monitoring(self, interval: int = 30):
-        """Start resource monitoring in a separate thread"""
+        """Start resource monitoring on the shared monitoring thread"""
+        global _monitor_thread
         if self.monitoring_active:
             logger.warning("Resource monitoring already active")
             return
-            
+        
+        # Passes start on a fixed cadence regardless of how long the checks take
+        self._monitor_interval = interval
+        self._next_pass = time.monotonic()
+        self._failed_passes = 0
         self.monitoring_active = True
-        self.monitoring_thread = threading.Thread(
-            target=self._monitoring_loop,
-            args=(interval,),
-            daemon=True
-        )
-        self.monitoring_thread.start()
+        
+        with _monitor_lock:
+            _monitors.add(self)
+            if _monitor_thread is None:
+                _monitor_thread = threading.Thread(
+                    target=_shared_monitoring_loop,
+                    name="resource-monitor",
+                    daemon=True
+                )
+                _monitor_thread.start()
+            self.monitoring_thread = _monitor_thread
+        _monitor_wake.set()
         logger.info(f"Started resource monitoring (interval: {interval}s)")
     
     def stop_monitoring(self):
         """Stop resource monitoring"""
         self.monitoring_active = False
-        if self.monitoring_thread:
-            self.monitoring_thread.join(timeout=5)
+        with _monitor_lock:
+            _monitors.discard(self)
+            # The shared thread exits once nothing is left to monitor
+            last_thread = _monitor_thread if not _monitors else None
+        _monitor_wake.set()
+        
+        if last_thread is not None and last_thread is not threading.current_thread():
+            last_thread.join(timeout=5)
         logger.info("Stopped resource monitoring")
     
-    def _monitoring_loop(self, interval: int):
-        """Main monitoring loop"""
-        while self.monitoring_active:
-            try:
-                self._check_memory_usage()
-                self._check_resource_age()
-                self._check_system_health()
-                time.sleep(interval)
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(interval)
+    def _monitoring_pass(self) -> bool:
+        """Run one round of monitoring checks; returns False if the pass failed"""
+        try:
+            # One batched /proc read feeds every check in the pass
+            sample = self._sample(max_age=0)
+            self._check_memory_usage(sample)
+            self._check_resource_age()
+            self._check_system_health(sample)
+            return True
+        except Exception as e:
+            logger.error(f"Error in monitoring loop: {e}")
+            return False
+    
+    def _schedule_next_pass(self, succeeded: bool):
+        """Set when the shared monitoring thread next runs this manager's checks"""
+        if succeeded:
+            self._failed_passes = 0
+            # A pass that overran skips the missed slots instead of running back to back
+            self._next_pass = max(self._next_pass + self._monitor_interval, time.monotonic())
+            return
+        
+        # Back off exponentially while passes keep failing rather than repeating the same error every interval
+        self._failed_passes += 1
+        delay = self._monitor_interval * 2 ** min(self._failed_passes, 16)
+        self._next_pass = time.monotonic() + min(delay, max(self.max_monitor_backoff, self._monitor_interval))
+    
+    def _sample(self, max_age: float = 1.0) -> Dict[str, float]:
+        """Sample process RSS, CPU, threads and fds, reusing a sample taken within max_age seconds"""
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache_ts < max_age:
+            return self._stats_cache
+        
+        # oneshot reads each /proc file once for all of the values below
+        with self.process.oneshot():
+            sample = {
+                'rss': self._read_rss(),
+                'cpu': self.process.cpu_percent(None),
+                'threads': self.process.num_threads(),
+                'fds': self.process.num_fds(),
+            }
+        self._stats_cache, self._stats_cache_ts = sample, now
+        return sample
+    
+    def _read_rss(self) -> int:
+        """Resident set size of this process in bytes"""
+        try:
+            # The second field of statm is resident pages; one short read instead of psutil's memory_info
+            with open("/proc/self/statm", "rb") as f:
+                return int(f.read().split()[1]) * self._page_size
+        except OSError:
+            return self.process.memory_info().rss
     
-    def _check_memory_usage(self):
+    def _check_memory_usage(self, sample: Optional[Dict[str, float]] = None):
         """Monitor and manage memory usage"""
         try:
-            memory_info = self.process.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
+            memory_mb = (sample or self._sample())['rss'] / 1024 / 1024
             
             if memory_mb > self.max_memory_mb:
                 logger.warning(f"High memory usage: {memory_mb:.1f}MB (limit: {self.max_memory_mb}MB)")
+                self._collect_if_idle()
                 self._trigger_memory_cleanup()
                 
                 # Check again after cleanup
-                memory_info = self.process.memory_info()
-                memory_mb = memory_info.rss / 1024 / 1024
+                memory_mb = self._sample(max_age=0)['rss'] / 1024 / 1024
                 logger.info(f"Memory usage after cleanup: {memory_mb:.1f}MB")
                 
         except Exception as e:
             logger.error(f"Error checking memory usage: {e}")
     
+    def _collect_if_idle(self):
+        """Collect the young generations unless the interpreter just collected on its own"""
+        if time.monotonic() - max(_gc_last_collection) < self.gc_idle_seconds:
+            return
+        
+        # Frozen long-lived objects are never rescanned, and generation 2 is left to the interpreter
+        collected = gc.collect(1)
+        logger.debug(f"Garbage collection freed {collected} objects")
+    
     def _check_resource_age(self):
         """Check for old resources that might need cleanup"""
-        current_time = time.time()
+        current_time = time.monotonic()
         old_resources = []
         
         with self._lock:
-            for name, info in self.active_resources.items():
-                age = current_time - info['created_at']
-                last_access_age = current_time - info['last_accessed']
+            self._drain_pending()
+            for name, entry in self.active_resources.items():
+                last_access_age = current_time - entry.last_accessed
+                if last_access_age <= 1800:
+                    break  # everything after this was accessed more recently
                 
                 # Flag resources older than 1 hour and not accessed in 30 minutes
-                if age > 3600 and last_access_age > 1800:
+                if current_time - entry.created_at > 3600:
                     old_resources.append(name)
         
         for name in old_resources:
             logger.info(f"Cleaning up old resource: {name}")
             self.cleanup_resource(name)
     
-    def _check_system_health(self):
+    def _check_system_health(self, sample: Optional[Dict[str, float]] = None):
         """Check overall system health"""
         try:
+            sample = sample or self._sample()
+            
             # Check CPU usage
-            cpu_percent = self.process.cpu_percent()
+            cpu_percent = sample['cpu']
             if cpu_percent > 80:
                 logger.warning(f"High CPU usage: {cpu_percent:.1f}%")
             
             # Check file descriptors
-            num_fds = self.process.num_fds()
+            num_fds = sample['fds']
             if num_fds > 100:  # Arbitrary threshold
                 logger.warning(f"High number of file descriptors: {num_fds}")
             
             # Check thread count
-            num_threads = self.process.num_threads()
+            num_threads = sample['threads']
             if num_threads > 20:  # Arbitrary threshold
                 logger.warning(f"High number of threads: {num_threads}")
                 
@@ -210,10 +465,6 @@ class ResourceManager:
         """Trigger memory cleanup procedures"""
         logger.info("Triggering memory cleanup...")
         
-        # Force garbage collection
-        collected = gc.collect()
-        logger.debug(f"Garbage collection freed {collected} objects")
-        
         # Clean up old resources
         self._cleanup_old_resources()
         
@@ -221,40 +472,58 @@ class ResourceManager:
         
     def _cleanup_old_resources(self):
         """Clean up resources that haven't been accessed recently"""
-        current_time = time.time()
+        current_time = time.monotonic()
         to_cleanup = []
         
         with self._lock:
-            for name, info in self.active_resources.items():
-                if current_time - info['last_accessed'] > 600:  # 10 minutes
-                    to_cleanup.append(name)
+            self._drain_pending()
+            for name, entry in self.active_resources.items():
+                if current_time - entry.last_accessed <= 600:  # 10 minutes
+                    break  # everything after this was accessed more recently
+                to_cleanup.append(name)
         
         for name in to_cleanup:
-            logger.debug(f"Cleaning up inactive resource: {name}")
+            logger.debug("Cleaning up inactive resource: %s", name)
             self.cleanup_resource(name)
     
     def get_resource_stats(self) -> Dict[str, Any]:
         """Get current resource statistics"""
         try:
-            memory_info = self.process.memory_info()
+            sample = self._sample()
             
             with self._lock:
+                self._drain_pending()
                 active_count = len(self.active_resources)
-                resource_names = list(self.active_resources.keys())
+                resource_keys = list(self.active_resources.keys())
+            resource_names = [
+                key if isinstance(key, str) else f"{key[0]}_{key[1]}" for key in resource_keys
+            ]
             
             return {
-                'memory_mb': memory_info.rss / 1024 / 1024,
+                'memory_mb': sample['rss'] / 1024 / 1024,
                 'memory_limit_mb': self.max_memory_mb,
                 'active_resources': active_count,
                 'resource_names': resource_names,
-                'cpu_percent': self.process.cpu_percent(),
-                'num_threads': self.process.num_threads(),
-                'num_fds': self.process.num_fds(),
+                'cpu_percent': sample['cpu'],
+                'num_threads': sample['threads'],
+                'num_fds': sample['fds'],
+                'gc_collections': list(_gc_collections),
             }
         except Exception as e:
             logger.error(f"Error getting resource stats: {e}")
             return {}
     
+    def get_cached_disk_usage(self, path: str, max_age: float = 30):
+        """Get psutil.disk_usage(path), reusing a sample taken within max_age seconds"""
+        now = time.monotonic()
+        cached = self._disk_usage_cache.get(path)
+        if cached is not None and now - cached[0] < max_age:
+            return cached[1]
+        
+        usage = psutil.disk_usage(path)
+        self._disk_usage_cache[path] = (now, usage)
+        return usage
+    
     @contextmanager
     def managed_resource(self, name: str, resource: Any, cleanup_func: Callable[[Any], None]):
         """Context manager for automatic resource management"""
@@ -270,26 +539,19 @@ class AudioResourceManager:
     
     def __init__(self, resource_manager: ResourceManager):
         self.resource_manager = resource_manager
-        self.audio_buffers: List[Any] = []
-        self.audio_streams: List[Any] = []
+        # Keyed by id(); entries vanish on their own once the buffer or stream is garbage collected
+        self.audio_buffers: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self.audio_streams: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
         
     def register_audio_buffer(self, buffer: Any):
         """Register an audio buffer for cleanup"""
-        self.audio_buffers.append(weakref.ref(buffer))
-        self.resource_manager.register_resource(
-            f"audio_buffer_{id(buffer)}", 
-            buffer, 
-            self._cleanup_buffer
-        )
+        self.audio_buffers[id(buffer)] = buffer
+        self.resource_manager.register_by_id("audio_buffer", buffer, self._cleanup_buffer)
     
     def register_audio_stream(self, stream: Any):
         """Register an audio stream for cleanup"""
-        self.audio_streams.append(weakref.ref(stream))
-        self.resource_manager.register_resource(
-            f"audio_stream_{id(stream)}", 
-            stream, 
-            self._cleanup_stream
-        )
+        self.audio_streams[id(stream)] = stream
+        self.resource_manager.register_by_id("audio_stream", stream, self._cleanup_stream)
     
     def _cleanup_buffer(self, buffer: Any):
         """Clean up audio buffer"""
@@ -313,24 +575,27 @@ class AudioResourceManager:
     
     def clear_all_buffers(self):
         """Clear all audio buffers"""
-        for buffer_ref in self.audio_buffers[:]:
-            buffer = buffer_ref()
-            if buffer is not None:
-                self._cleanup_buffer(buffer)
+        for buffer in list(self.audio_buffers.values()):
+            self._cleanup_buffer(buffer)
         self.audio_buffers.clear()
 
 
 # Global resource manager instance
 _global_resource_manager: Optional[ResourceManager] = None
+_global_resource_manager_lock = threading.Lock()
 
 
+@functools.lru_cache(maxsize=None)
 def get_resource_manager() -> ResourceManager:
-    """Get the global resource manager instance"""
+    """Get the global resource manager instance (safe to call from any thread)"""
+    # Only reached until the first result is cached; the lock keeps racing
+    # first callers from constructing and monitoring two managers
     global _global_resource_manager
-    if _global_resource_manager is None:
-        _global_resource_manager = ResourceManager()
-        _global_resource_manager.start_monitoring()
-    return _global_resource_manager
+    with _global_resource_manager_lock:
+        if _global_resource_manager is None:
+            _global_resource_manager = ResourceManager()
+            _global_resource_manager.start_monitoring()
+        return _global_resource_manager
 
 
 def cleanup_on_exit():
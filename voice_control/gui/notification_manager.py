@@ -6,9 +6,12 @@ Provides comprehensive notification system for status updates, errors,
 and user feedback through system tray notifications.
 """
 
+import heapq
+import itertools
 import logging
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from collections import deque
+from typing import Optional, List, Deque, Dict, Any, Tuple
+from datetime import datetime
 from enum import Enum
 import threading
 import time
@@ -39,6 +42,30 @@ class NotificationType(Enum):
     STATUS_UPDATE = "status_update"
 
 
+# Qt tray icon for each notification type (unlisted types use Information)
+if PYQT_AVAILABLE:
+    _QT_ICON_MAP = {
+        NotificationType.INFO: QSystemTrayIcon.Information,
+        NotificationType.SUCCESS: QSystemTrayIcon.Information,
+        NotificationType.WARNING: QSystemTrayIcon.Warning,
+        NotificationType.ERROR: QSystemTrayIcon.Critical,
+        NotificationType.VOICE_COMMAND: QSystemTrayIcon.Information,
+        NotificationType.STATUS_UPDATE: QSystemTrayIcon.Information,
+    }
+else:
+    _QT_ICON_MAP = {}
+
+# Console prefix for each notification type in the fallback
+_FALLBACK_PREFIX = {
+    NotificationType.INFO: "ℹ️",
+    NotificationType.SUCCESS: "✅",
+    NotificationType.WARNING: "⚠️",
+    NotificationType.ERROR: "❌",
+    NotificationType.VOICE_COMMAND: "🎤",
+    NotificationType.STATUS_UPDATE: "📊",
+}
+
+
 class NotificationPriority(Enum):
     """Notification priority levels"""
     LOW = 1
@@ -53,7 +80,8 @@ class Notification:
     def __init__(self, title: str, message: str, 
                  notification_type: NotificationType = NotificationType.INFO,
                  priority: NotificationPriority = NotificationPriority.NORMAL,
-                 duration: int = 3000, persistent: bool = False):
+                 duration: int = 3000, persistent: bool = False,
+                 timestamp: Optional[float] = None):
         self.id = id(self)
         self.title = title
         self.message = message
@@ -61,12 +89,12 @@ class Notification:
         self.priority = priority
         self.duration = duration
         self.persistent = persistent
-        self.timestamp = datetime.now()
+        self.timestamp = time.time() if timestamp is None else timestamp  # epoch seconds
         self.shown = False
         self.dismissed = False
     
     def __str__(self):
-        return f"[{self.timestamp.strftime('%H:%M:%S')}] {self.title}: {self.message}"
+        return f"[{datetime.fromtimestamp(self.timestamp).strftime('%H:%M:%S')}] {self.title}: {self.message}"
 
 
 class NotificationManager(QObject if PYQT_AVAILABLE else object):
@@ -82,7 +110,9 @@ class NotificationManager(QObject if PYQT_AVAILABLE else object):
             super().__init__()
         
         self.tray_icon = tray_icon
-        self.notification_queue: List[Notification] = []
+        # Heap of (-priority, sequence, notification): highest priority first, FIFO within a priority
+        self.notification_queue: List[Tuple[int, int, Notification]] = []
+        self._queue_sequence = itertools.count()
         self.notification_history: List[Notification] = []
         self.max_history_size = 100
         self.is_showing_notification = False
@@ -91,18 +121,30 @@ class NotificationManager(QObject if PYQT_AVAILABLE else object):
         # Configuration
         self.notifications_enabled = True
         self.max_queue_size = 10
-        self.rate_limit_window = timedelta(seconds=5)
+        self.rate_limit_window = 5.0  # seconds
         self.max_notifications_per_window = 3
-        self.recent_notifications = []
+        # (time shown, notification), oldest first; shown order, not creation order, since the queue reorders by priority
+        self.recent_notifications: Deque[Tuple[float, Notification]] = deque()
+        
+        # Pending dismissals for the non-Qt fallback: heap of (monotonic due time, sequence, notification)
+        self._dismiss_heap: List[Tuple[float, int, Notification]] = []
+        self._dismiss_condition = threading.Condition()
         
         # Setup processing timer
         if PYQT_AVAILABLE:
             self.process_timer = QTimer()
             self.process_timer.timeout.connect(self._process_queue)
             self.process_timer.start(500)  # Process every 500ms
+            
+            # Only one notification is shown at a time, so one timer dismisses them all
+            self._dismiss_pending: Optional[Notification] = None
+            self.dismiss_timer = QTimer()
+            self.dismiss_timer.setSingleShot(True)
+            self.dismiss_timer.timeout.connect(self._dismiss_pending_notification)
         else:
             # Fallback for non-Qt environments
             self._start_background_processor()
+            threading.Thread(target=self._dismissal_loop, daemon=True).start()
     
     def _start_background_processor(self):
         """Start background thread for processing notifications (non-Qt fallback)"""
@@ -128,8 +170,11 @@ class NotificationManager(QObject if PYQT_AVAILABLE else object):
                 logger.debug(f"Notifications disabled, skipping: {title}")
                 return False
             
+            # One clock read serves both the rate limit check and the notification's timestamp
+            now = time.time()
+            
             # Check rate limiting
-            if not self._check_rate_limit():
+            if not self._check_rate_limit(now):
                 logger.warning("Notification rate limit exceeded, skipping")
                 return False
             
@@ -140,7 +185,8 @@ class NotificationManager(QObject if PYQT_AVAILABLE else object):
                 notification_type=notification_type,
                 priority=priority,
                 duration=duration,
-                persistent=persistent
+                persistent=persistent,
+                timestamp=now
             )
             
             # Add to queue
@@ -206,36 +252,31 @@ class NotificationManager(QObject if PYQT_AVAILABLE else object):
     
     def _add_to_queue(self, notification: Notification):
         """Add notification to queue with priority handling"""
-        # Remove old notifications if queue is full
-        if len(self.notification_queue) >= self.max_queue_size:
-            # Remove lowest priority notifications first
-            self.notification_queue.sort(key=lambda n: n.priority.value, reverse=True)
-            removed = self.notification_queue.pop()
-            logger.debug(f"Queue full, removed notification: {removed.title}")
+        queue = self.notification_queue
         
-        # Insert based on priority
-        inserted = False
-        for i, queued_notification in enumerate(self.notification_queue):
-            if notification.priority.value > queued_notification.priority.value:
-                self.notification_queue.insert(i, notification)
-                inserted = True
-                break
+        # Remove old notifications if queue is full
+        if len(queue) >= self.max_queue_size:
+            # Remove the newest of the lowest priority notifications; the queue is
+            # small and bounded, so a scan and re-heapify beats keeping a second heap
+            victim = max(queue)
+            queue.remove(victim)
+            heapq.heapify(queue)
+            logger.debug(f"Queue full, removed notification: {victim[2].title}")
         
-        if not inserted:
-            self.notification_queue.append(notification)
+        heapq.heappush(queue, (-notification.priority.value, next(self._queue_sequence), notification))
     
-    def _check_rate_limit(self) -> bool:
+    def _check_rate_limit(self, now: Optional[float] = None) -> bool:
         """Check if we're within rate limits"""
-        now = datetime.now()
+        if now is None:
+            now = time.time()
         
-        # Clean old notifications from recent list
-        self.recent_notifications = [
-            n for n in self.recent_notifications
-            if now - n.timestamp < self.rate_limit_window
-        ]
+        # Drop notifications that have left the window; they were appended in the order shown
+        recent = self.recent_notifications
+        while recent and now - recent[0][0] >= self.rate_limit_window:
+            recent.popleft()
         
         # Check if we're under the limit
-        return len(self.recent_notifications) < self.max_notifications_per_window
+        return len(recent) < self.max_notifications_per_window
     
     def _process_queue(self):
         """Process notification queue"""
@@ -245,7 +286,7 @@ class NotificationManager(QObject if PYQT_AVAILABLE else object):
                 return
             
             # Get next notification
-            notification = self.notification_queue.pop(0)
+            notification = heapq.heappop(self.notification_queue)[2]
             
             # Show the notification
             self._show_notification_now(notification)
@@ -260,7 +301,7 @@ class NotificationManager(QObject if PYQT_AVAILABLE else object):
             self.current_notification = notification
             
             # Add to recent notifications for rate limiting
-            self.recent_notifications.append(notification)
+            self.recent_notifications.append((time.time(), notification))
             
             # Add to history
             self._add_to_history(notification)
@@ -290,17 +331,7 @@ class NotificationManager(QObject if PYQT_AVAILABLE else object):
     
     def _show_qt_notification(self, notification: Notification):
         """Show notification using Qt system tray"""
-        # Map notification types to Qt icons
-        icon_map = {
-            NotificationType.INFO: QSystemTrayIcon.Information,
-            NotificationType.SUCCESS: QSystemTrayIcon.Information,
-            NotificationType.WARNING: QSystemTrayIcon.Warning,
-            NotificationType.ERROR: QSystemTrayIcon.Critical,
-            NotificationType.VOICE_COMMAND: QSystemTrayIcon.Information,
-            NotificationType.STATUS_UPDATE: QSystemTrayIcon.Information,
-        }
-        
-        icon = icon_map.get(notification.type, QSystemTrayIcon.Information)
+        icon = _QT_ICON_MAP.get(notification.type, QSystemTrayIcon.Information)
         
         self.tray_icon.showMessage(
             notification.title,
@@ -311,33 +342,43 @@ class NotificationManager(QObject if PYQT_AVAILABLE else object):
     
     def _show_fallback_notification(self, notification: Notification):
         """Show notification using fallback method (console log)"""
-        type_prefix = {
-            NotificationType.INFO: "ℹ️",
-            NotificationType.SUCCESS: "✅",
-            NotificationType.WARNING: "⚠️",
-            NotificationType.ERROR: "❌",
-            NotificationType.VOICE_COMMAND: "🎤",
-            NotificationType.STATUS_UPDATE: "📊",
-        }
-        
-        prefix = type_prefix.get(notification.type, "ℹ️")
+        prefix = _FALLBACK_PREFIX.get(notification.type, "ℹ️")
         print(f"{prefix} {notification.title}: {notification.message}")
     
     def _schedule_dismissal(self, notification: Notification):
         """Schedule notification dismissal"""
         if PYQT_AVAILABLE:
-            dismiss_timer = QTimer()
-            dismiss_timer.setSingleShot(True)
-            dismiss_timer.timeout.connect(lambda: self._dismiss_notification(notification))
-            dismiss_timer.start(notification.duration)
+            self._dismiss_pending = notification
+            self.dismiss_timer.start(notification.duration)
         else:
-            # Fallback for non-Qt
-            def dismiss_later():
-                time.sleep(notification.duration / 1000.0)
-                self._dismiss_notification(notification)
+            # Fallback for non-Qt: hand it to the dismissal thread
+            due = time.monotonic() + notification.duration / 1000.0
+            with self._dismiss_condition:
+                heapq.heappush(self._dismiss_heap, (due, next(self._queue_sequence), notification))
+                self._dismiss_condition.notify()
+    
+    def _dismiss_pending_notification(self):
+        """Dismiss the notification the Qt dismissal timer was started for"""
+        notification, self._dismiss_pending = self._dismiss_pending, None
+        if notification is not None:
+            self._dismiss_notification(notification)
+    
+    def _dismissal_loop(self):
+        """Dismiss notifications as they come due (non-Qt fallback)"""
+        heap = self._dismiss_heap
+        while True:
+            with self._dismiss_condition:
+                # Sleep until the earliest dismissal is due, or until a new one is scheduled
+                while not heap or heap[0][0] > time.monotonic():
+                    self._dismiss_condition.wait(heap[0][0] - time.monotonic() if heap else None)
+                
+                now = time.monotonic()
+                due = []
+                while heap and heap[0][0] <= now:
+                    due.append(heapq.heappop(heap)[2])
             
-            dismiss_thread = threading.Thread(target=dismiss_later, daemon=True)
-            dismiss_thread.start()
+            for notification in due:
+                self._dismiss_notification(notification)
     
     def _dismiss_notification(self, notification: Notification):
         """Dismiss a notification"""
@@ -63,6 +63,7 @@ def main():
     
     # Initialize resource manager and error handler
     resource_manager = get_resource_manager()
+    resource_manager.install_signal_handlers_from_main_thread()
     error_handler = get_error_handler()
     
     logger.info("Starting Voice Control Application with stability fixes")
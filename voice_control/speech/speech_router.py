@@ -184,8 +184,11 @@ class SpeechRecognitionRouter:
             self._update_stats(backend_name, False, 0)
             
             # Handle the error through error handler
-            error = RecognitionError(f"{backend_name} recognition failed: {e}")
-            self.error_handler.handle_error(error, f"speech_recognition_{backend_name}")
+            error = RecognitionError.acquire(f"{backend_name} recognition failed: {e}")
+            try:
+                self.error_handler.handle_error(error, f"speech_recognition_{backend_name}")
+            finally:
+                error.release()
             
             return None
     